@@ -1,4 +1,5 @@
 import sys
+import asyncio
 import yaml
 import typer
 import shutil
@@ -20,6 +21,8 @@ from typing import Optional
 import random
 import string
 from google.cloud import storage
+from google.api_core.exceptions import GoogleAPIError
+from google.auth.exceptions import GoogleAuthError
 import hashlib
 
 # Import refactored utility functions
@@ -33,6 +36,42 @@ from deployml.utils.helpers import (
     cleanup_cloud_sql_resources,
     cleanup_terraform_files,
     run_terraform_with_loading_bar,
+    resolve_performance,
+    update_performance,
+    workspace_terraform_dir,
+)
+from deployml.utils.warmup import (
+    collect_service_urls,
+    print_warmup_report,
+    read_terraform_outputs,
+    service_url,
+    serving_model_name,
+    warm_services,
+)
+from deployml.utils.loadtest import (
+    RequestSpec,
+    docker_resource_args,
+    find_knee,
+    print_load_table,
+    run_load,
+    start_local_container,
+    stop_local_container,
+    sweep_concurrency,
+)
+from deployml.utils.bench import (
+    SCENARIOS as BENCH_SCENARIOS,
+    feast_specs,
+    load_payload,
+    mlflow_specs,
+    predict_specs,
+    scenario_urls,
+)
+from deployml.utils.data_push import (
+    SUPPORTED_SUFFIXES as PUSH_SUFFIXES,
+    find_artifact_bucket,
+    print_push_report,
+    push_dataset,
+    resolve_table_id,
 )
 from deployml.utils.infracost import (
     check_infracost_available,
@@ -43,8 +82,11 @@ from deployml.utils.infracost import (
 import re
 import time
 import json
+import math
 
 cli = typer.Typer()
+data_app = typer.Typer(help="Move datasets into a deployed stack")
+cli.add_typer(data_app, name="data")
 
 
 @cli.command()
@@ -313,6 +355,14 @@ def deploy(
     yes: bool = typer.Option(
         False, "--yes", "-y", help="Skip confirmation prompts and deploy"
     ),
+    warm: bool = typer.Option(
+        True,
+        "--warm/--no-warm",
+        help="Hit every service after deploy and report cold-start times",
+    ),
+    warm_timeout: float = typer.Option(
+        300.0, "--warm-timeout", help="Seconds to wait for each service to warm up"
+    ),
 ):
     """
     Deploy infrastructure based on a YAML configuration file.
@@ -358,11 +408,10 @@ def deploy(
                             "postgresql"
                         )
 
-    workspace_name = config.get("name") or "development"
-
-    DEPLOYML_DIR = Path.cwd() / ".deployml" / workspace_name
-    DEPLOYML_TERRAFORM_DIR = DEPLOYML_DIR / "terraform"
-    DEPLOYML_MODULES_DIR = DEPLOYML_DIR / "terraform" / "modules"
+    DEPLOYML_TERRAFORM_DIR = workspace_terraform_dir(config)
+    DEPLOYML_DIR = DEPLOYML_TERRAFORM_DIR.parent
+    DEPLOYML_MODULES_DIR = DEPLOYML_TERRAFORM_DIR / "modules"
+    workspace_name = DEPLOYML_DIR.name
 
     typer.echo(f"📁 Using workspace: {workspace_name}")
     typer.echo(f"📍 Workspace path: {DEPLOYML_DIR}")
@@ -402,6 +451,21 @@ def deploy(
                 }
             )
 
+    # Expand per-stage performance presets into explicit Cloud Run settings
+    if deployment_type == "cloud_run":
+        for stage in stack:
+            for stage_name, tool in stage.items():
+                params = tool.get("params") or {}
+                if "performance" not in params:
+                    continue
+                try:
+                    params["performance"] = resolve_performance(
+                        params["performance"]
+                    )
+                except ValueError as e:
+                    typer.echo(f"❌ Invalid performance block for {stage_name}: {e}")
+                    raise typer.Exit(code=1)
+
     typer.echo("📦 Copying module templates...")
     copy_modules_to_workspace(
         DEPLOYML_MODULES_DIR,
@@ -718,6 +782,9 @@ def deploy(
                         typer.echo("No outputs found in Terraform state.")
                 except Exception as e:
                     typer.echo(f"⚠️ Failed to parse Terraform outputs: {e}")
+                    outputs = {}
+                if warm and outputs:
+                    run_warmup(outputs, config, warm_timeout)
             else:
                 typer.echo("⚠️ Could not retrieve Terraform outputs.")
         else:
@@ -727,6 +794,379 @@ def deploy(
         typer.echo("❌ Deployment cancelled")
 
 
+def run_warmup(outputs: dict, config: dict, timeout: float):
+    """
+    Warm every service found in the Terraform outputs and print cold-start times.
+    """
+    services = collect_service_urls(outputs)
+    if not services:
+        typer.echo("ℹ️ No service URLs found to warm up.")
+        return
+    typer.echo(
+        f"\n🔥 Warming up {len(services)} service(s) (timeout {timeout:.0f}s each)..."
+    )
+    results = warm_services(
+        services, timeout=timeout, model_name=serving_model_name(config)
+    )
+    print_warmup_report(results)
+    if not all(result.up for result in results):
+        typer.secho(
+            "⚠️ Some services did not respond; they may still be starting.",
+            fg=typer.colors.YELLOW,
+        )
+
+
+@cli.command()
+def warm(
+    config_path: Path = typer.Option(
+        ..., "--config-path", "-c", help="Path to YAML config file"
+    ),
+    timeout: float = typer.Option(
+        300.0, "--timeout", help="Seconds to wait for each service to warm up"
+    ),
+):
+    """
+    Pre-spin deployed services, preload the serving model and report cold-start times.
+    """
+    if not config_path.exists():
+        typer.echo(f"❌ Config file not found: {config_path}")
+        raise typer.Exit(code=1)
+
+    config = yaml.safe_load(config_path.read_text())
+    terraform_dir = workspace_terraform_dir(config)
+    if not terraform_dir.exists():
+        typer.echo(f"❌ No workspace found for {terraform_dir.parent.name}. Deploy first.")
+        raise typer.Exit(code=1)
+
+    outputs = read_terraform_outputs(terraform_dir)
+    if not outputs:
+        typer.echo("⚠️ Could not retrieve Terraform outputs.")
+        raise typer.Exit(code=1)
+    run_warmup(outputs, config, timeout)
+
+
+@cli.command()
+def tune(
+    config_path: Path = typer.Option(
+        ..., "--config-path", "-c", help="Path to YAML config file"
+    ),
+    stage: str = typer.Option(
+        "model_serving",
+        "--stage",
+        help="Stack stage to tune (e.g. model_serving, feature_store)",
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", help="Service URL (defaults to the Terraform output)"
+    ),
+    docker_image: Optional[str] = typer.Option(
+        None,
+        "--docker-image",
+        help="Tune a local container of this image with the stage's CPU/memory limits",
+    ),
+    path: str = typer.Option(
+        "/predict", "--path", help="Request path to load test"
+    ),
+    payload: Optional[Path] = typer.Option(
+        None, "--payload", help="JSON file POSTed to --path (GET when omitted)"
+    ),
+    levels: str = typer.Option(
+        "1,2,4,8,16,32,64,128",
+        "--levels",
+        help="Comma-separated concurrency levels to step through",
+    ),
+    duration: float = typer.Option(
+        20.0, "--duration", help="Seconds to hold each concurrency level"
+    ),
+    p99_slo_ms: Optional[float] = typer.Option(
+        None, "--p99-slo-ms", help="Discard levels whose p99 latency exceeds this"
+    ),
+    target_rps: Optional[float] = typer.Option(
+        None,
+        "--target-rps",
+        help="Peak requests/second to plan for; sets max_instances",
+    ),
+    write: bool = typer.Option(
+        True, "--write/--no-write", help="Write recommendations back to the YAML"
+    ),
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Write recommendations without confirmation"
+    ),
+):
+    """
+    Load test a service at increasing concurrency and recommend container_concurrency.
+
+    For per-instance numbers against Cloud Run, deploy with max_instances: 1
+    while tuning, or use --docker-image to run the image locally.
+    """
+    if not config_path.exists():
+        typer.echo(f"❌ Config file not found: {config_path}")
+        raise typer.Exit(code=1)
+
+    config = yaml.safe_load(config_path.read_text())
+    tool = next(
+        (t for s in config.get("stack", []) for n, t in s.items() if n == stage),
+        None,
+    )
+    if tool is None:
+        typer.echo(f"❌ Stage '{stage}' not found in {config_path}")
+        raise typer.Exit(code=1)
+    params = tool.get("params") or {}
+
+    try:
+        concurrency_levels = sorted({int(level) for level in levels.split(",")})
+    except ValueError:
+        typer.echo(f"❌ Invalid --levels: {levels}")
+        raise typer.Exit(code=1)
+
+    specs = [
+        RequestSpec("POST", path, json=json.loads(payload.read_text()))
+        if payload
+        else RequestSpec("GET", path)
+    ]
+
+    container_id = None
+    if docker_image:
+        port = 18080
+        resource_args = docker_resource_args(
+            params.get("cpu_limit", "2000m"), params.get("memory_limit", "2Gi")
+        )
+        typer.echo(f"🐳 Starting {docker_image} locally ({' '.join(resource_args)})...")
+        try:
+            container_id = start_local_container(docker_image, port, resource_args)
+        except RuntimeError as e:
+            typer.echo(f"❌ Could not start container: {e}")
+            raise typer.Exit(code=1)
+        url = f"http://127.0.0.1:{port}"
+    elif not url:
+        url = service_url(
+            read_terraform_outputs(workspace_terraform_dir(config)), stage, tool.get("name", "")
+        )
+        if not url:
+            typer.echo(
+                f"❌ No URL found for {stage}; deploy first or pass --url / --docker-image"
+            )
+            raise typer.Exit(code=1)
+
+    typer.echo(
+        f"📈 Tuning {stage} at {url}{path}: levels {concurrency_levels}, {duration:.0f}s each"
+    )
+    try:
+        results = sweep_concurrency(
+            url,
+            specs,
+            concurrency_levels,
+            duration,
+            on_result=lambda r: typer.echo(
+                f"  c={r.concurrency}: {r.throughput:.1f} rps, p99 {r.percentile(99) or 0:.0f} ms, errors {r.error_rate:.1%}"
+            ),
+        )
+    finally:
+        if container_id:
+            stop_local_container(container_id)
+
+    knee = find_knee(results, p99_slo_ms=p99_slo_ms)
+    print_load_table(results, f"Concurrency sweep: {stage}", highlight=knee)
+    if knee is None:
+        typer.echo("❌ No concurrency level met the error-rate / latency limits.")
+        raise typer.Exit(code=1)
+
+    recommended = {"container_concurrency": knee.concurrency}
+    if target_rps:
+        recommended["max_instances"] = max(1, math.ceil(target_rps / knee.throughput))
+    typer.secho(
+        f"✅ Knee at concurrency {knee.concurrency}: {knee.throughput:.1f} rps, "
+        f"p95 {knee.percentile(95):.0f} ms, p99 {knee.percentile(99):.0f} ms",
+        fg=typer.colors.GREEN,
+    )
+    typer.echo(f"💡 Recommended performance settings: {recommended}")
+
+    if write and (yes or typer.confirm(f"Write these into {config_path}?")):
+        update_performance(config_path, stage, recommended)
+        typer.echo(f"📝 Updated {stage}.params.performance in {config_path}")
+
+
+@cli.command()
+def bench(
+    config_path: Path = typer.Option(
+        ..., "--config-path", "-c", help="Path to YAML config file"
+    ),
+    scenarios: str = typer.Option(
+        ",".join(BENCH_SCENARIOS),
+        "--scenarios",
+        help="Comma-separated scenarios: predict, feast, mlflow",
+    ),
+    concurrency: int = typer.Option(
+        8, "--concurrency", help="Concurrent requests (in-flight cap with --rate)"
+    ),
+    rate: Optional[float] = typer.Option(
+        None, "--rate", help="Target requests/second (open loop) instead of closed loop"
+    ),
+    duration: float = typer.Option(
+        30.0, "--duration", help="Seconds to run each scenario"
+    ),
+    predict_payload: Optional[Path] = typer.Option(
+        None, "--predict-payload", help="JSON body for /predict (default: zero rows from /model-info)"
+    ),
+    batch_size: int = typer.Option(
+        1, "--batch-size", help="Rows per generated /predict request"
+    ),
+    feast_payload: Optional[Path] = typer.Option(
+        None, "--feast-payload", help="JSON body for /get-online-features (features + entity keys)"
+    ),
+    json_out: Optional[Path] = typer.Option(
+        None, "--json-out", help="Also write the results to this JSON file"
+    ),
+):
+    """
+    Benchmark a deployed stack: latency percentiles, throughput and error rate per scenario.
+    """
+    if not config_path.exists():
+        typer.echo(f"❌ Config file not found: {config_path}")
+        raise typer.Exit(code=1)
+
+    config = yaml.safe_load(config_path.read_text())
+    terraform_dir = workspace_terraform_dir(config)
+    workspace_name = terraform_dir.parent.name
+    outputs = read_terraform_outputs(terraform_dir)
+    if not outputs:
+        typer.echo(f"❌ No Terraform outputs for {workspace_name}. Deploy first.")
+        raise typer.Exit(code=1)
+    urls = scenario_urls(outputs)
+
+    selected = [name.strip() for name in scenarios.split(",") if name.strip()]
+    unknown = set(selected) - set(BENCH_SCENARIOS)
+    if unknown:
+        typer.echo(f"❌ Unknown scenario(s): {', '.join(sorted(unknown))}")
+        raise typer.Exit(code=1)
+
+    results = []
+    for name in selected:
+        url = urls.get(name)
+        if not url:
+            typer.echo(f"⏭️  Skipping {name}: service not in this stack")
+            continue
+        try:
+            if name == "predict":
+                specs = predict_specs(url, load_payload(predict_payload), batch_size)
+            elif name == "feast":
+                specs = feast_specs(load_payload(feast_payload))
+            else:
+                specs = mlflow_specs(url)
+        except ValueError as e:
+            typer.echo(f"⏭️  Skipping {name}: {e}")
+            continue
+
+        mode = f"{rate:g} rps" if rate else f"concurrency {concurrency}"
+        typer.echo(f"🏁 {name}: {url} ({mode}, {duration:.0f}s)")
+        results.append(
+            asyncio.run(
+                run_load(
+                    url,
+                    specs,
+                    concurrency=concurrency,
+                    duration=duration,
+                    rate=rate,
+                    name=name,
+                )
+            )
+        )
+
+    if not results:
+        typer.echo("❌ Nothing to benchmark.")
+        raise typer.Exit(code=1)
+
+    print_load_table(results, f"Benchmark: {workspace_name}")
+    if json_out:
+        report = {
+            "workspace": workspace_name,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "concurrency": concurrency,
+            "rate": rate,
+            "duration_seconds": duration,
+            "results": [result.summary() for result in results],
+        }
+        json_out.write_text(json.dumps(report, indent=2))
+        typer.echo(f"📝 Results written to {json_out}")
+
+
+@data_app.command("push")
+def data_push(
+    file: Path = typer.Argument(..., help="Local CSV or Parquet file"),
+    config_path: Path = typer.Option(
+        ..., "--config-path", "-c", help="Path to YAML config file"
+    ),
+    bucket: Optional[str] = typer.Option(
+        None, "--bucket", help="GCS bucket for the shards (default: the stack's artifact bucket)"
+    ),
+    dataset: Optional[str] = typer.Option(
+        None, "--dataset", help="BigQuery dataset (default: the feature_store bigquery_dataset)"
+    ),
+    table: Optional[str] = typer.Option(
+        None, "--table", help="BigQuery table (default: derived from the file name)"
+    ),
+    rows_per_shard: int = typer.Option(
+        1_000_000, "--rows-per-shard", help="Maximum rows per Parquet shard"
+    ),
+    compression: str = typer.Option(
+        "zstd", "--compression", help="Parquet codec: zstd, snappy or gzip"
+    ),
+    workers: int = typer.Option(8, "--workers", help="Concurrent shard uploads"),
+    replace: bool = typer.Option(
+        False, "--replace/--append", help="Truncate the table instead of appending"
+    ),
+    time_partition_field: Optional[str] = typer.Option(
+        None, "--time-partition-field", help="Column for daily partitioning of a new table"
+    ),
+    local_dir: Optional[Path] = typer.Option(
+        None, "--local-dir", help="Write and keep the shards here (default: temporary directory)"
+    ),
+):
+    """
+    Shard a local file to Parquet, upload it to GCS and load it into the Feast offline store.
+    """
+    if not config_path.exists():
+        typer.echo(f"❌ Config file not found: {config_path}")
+        raise typer.Exit(code=1)
+    if not file.exists():
+        typer.echo(f"❌ Data file not found: {file}")
+        raise typer.Exit(code=1)
+    if file.suffix.lower() not in PUSH_SUFFIXES:
+        typer.echo(f"❌ Unsupported file type {file.suffix}; use {', '.join(PUSH_SUFFIXES)}")
+        raise typer.Exit(code=1)
+
+    config = yaml.safe_load(config_path.read_text())
+    project_id = config.get("provider", {}).get("project_id") or None
+    terraform_dir = workspace_terraform_dir(config)
+    outputs = read_terraform_outputs(terraform_dir)
+
+    bucket = bucket or find_artifact_bucket(outputs)
+    if not bucket:
+        typer.echo(f"❌ No artifact bucket in the outputs for {terraform_dir.parent.name}; pass --bucket")
+        raise typer.Exit(code=1)
+
+    try:
+        table_id = resolve_table_id(config, outputs, file, dataset, table)
+        typer.echo(f"📦 Pushing {file} → gs://{bucket} → {table_id}")
+        prefix, steps = push_dataset(
+            file,
+            bucket,
+            table_id,
+            project_id=project_id,
+            rows_per_shard=rows_per_shard,
+            compression=compression,
+            max_workers=workers,
+            write_disposition="WRITE_TRUNCATE" if replace else "WRITE_APPEND",
+            time_partition_field=time_partition_field,
+            local_dir=local_dir,
+        )
+    except (ImportError, ValueError, RuntimeError, GoogleAPIError, GoogleAuthError) as e:
+        typer.echo(f"❌ Data push failed: {e}")
+        raise typer.Exit(code=1)
+
+    print_push_report(steps, f"Data push: {file.name}")
+    typer.echo(f"✅ Loaded {steps[-1].rows or 0:,} rows into {table_id} (shards in {prefix})")
+
+
 @cli.command()
 def destroy(
     config_path: Path = typer.Option(
@@ -751,13 +1191,11 @@ def destroy(
 
     config = yaml.safe_load(config_path.read_text())
 
-    # Determine workspace name (same logic as deploy)
-    workspace_name = config.get("name") or "default"
-
-    # Find the workspace
-    DEPLOYML_DIR = Path.cwd() / ".deployml" / workspace_name
-    DEPLOYML_TERRAFORM_DIR = DEPLOYML_DIR / "terraform"
-    DEPLOYML_MODULES_DIR = DEPLOYML_DIR / "terraform" / "modules"
+    # Find the workspace (same logic as deploy)
+    DEPLOYML_TERRAFORM_DIR = workspace_terraform_dir(config)
+    DEPLOYML_DIR = DEPLOYML_TERRAFORM_DIR.parent
+    DEPLOYML_MODULES_DIR = DEPLOYML_TERRAFORM_DIR / "modules"
+    workspace_name = DEPLOYML_DIR.name
 
     if not DEPLOYML_TERRAFORM_DIR.exists():
         typer.echo(f"⚠️ No workspace found for {workspace_name}")
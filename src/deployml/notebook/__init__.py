@@ -18,15 +18,23 @@ Example usage:
     
     # Access MLflow client
     mlflow_client = stack.mlflow
+    
+    # Build a training set from the Feast offline store
+    retrieval = stack.feast.get_historical_features(entity_df, features)
+    retrieval.memory_report()
+    df = retrieval.to_df()
 """
 
 from .deployment import deploy, load
 from .stack import DeploymentStack
+from .feast import FeastHelper, HistoricalRetrieval
 from .urls import ServiceURLs
 
 __all__ = [
     'deploy',
     'load', 
     'DeploymentStack',
+    'FeastHelper',
+    'HistoricalRetrieval',
     'ServiceURLs'
 ]
\ No newline at end of file
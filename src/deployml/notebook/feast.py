@@ -0,0 +1,282 @@
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+
+def _format_bytes(num_bytes: Optional[float]) -> str:
+    if num_bytes is None:
+        return "unknown"
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if abs(num_bytes) < 1024 or unit == "TB":
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
+class HistoricalRetrieval:
+    """
+    Lazy handle on a Feast historical retrieval against the BigQuery offline store
+
+    Nothing is downloaded until `to_dataset`, `to_arrow` or `to_df` is called.
+    The point-in-time join runs inside BigQuery into a temporary table, which
+    is then pulled as Parquet shards in parallel, either through the Storage
+    Read API (one Arrow stream per worker) or through an export to GCS.
+    The temporary table is deleted once downloaded and expires after
+    `RESULT_TTL_HOURS` if it never is.
+    """
+
+    METHODS = ("storage", "export")
+    RESULT_TTL_HOURS = 24
+
+    def __init__(
+        self,
+        job,
+        entity_df: Union[pd.DataFrame, str],
+        project_id: str,
+        method: str = "storage",
+        staging_uri: Optional[str] = None,
+        local_dir: Optional[str] = None,
+        max_workers: int = 8,
+    ):
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of {self.METHODS}")
+        if method == "export" and not (staging_uri or "").startswith("gs://"):
+            raise ValueError("method='export' needs staging_uri='gs://bucket/prefix'")
+        self.job = job
+        self.entity_df = entity_df
+        self.project_id = project_id
+        self.method = method
+        self.staging_uri = staging_uri
+        self.local_dir = local_dir
+        self.max_workers = max_workers
+        self._table: Optional[str] = None
+        self._dataset = None
+
+    def _bigquery(self):
+        try:
+            from google.cloud import bigquery
+        except ImportError:
+            raise ImportError("Historical retrieval needs google-cloud-bigquery: pip install 'deployml-core[feast]'")
+        return bigquery.Client(project=self.project_id or None)
+
+    @property
+    def table(self) -> str:
+        """BigQuery table holding the joined training set (runs the join once)"""
+        if self._table is None:
+            table_id = self.job.to_bigquery()
+            client = self._bigquery()
+            table = client.get_table(table_id)
+            table.expires = datetime.now(timezone.utc) + timedelta(hours=self.RESULT_TTL_HOURS)
+            client.update_table(table, ["expires"])
+            self._table = table_id
+        return self._table
+
+    def memory_report(self, show: bool = True) -> Dict[str, Any]:
+        """Report entity and result sizes before anything is downloaded
+
+        Runs the point-in-time join in BigQuery (if it has not run yet) and
+        reads the result table's metadata; no rows leave BigQuery.
+
+        Args:
+            show: Print the report as well as returning it
+        """
+        report: Dict[str, Any] = {"method": self.method}
+        if isinstance(self.entity_df, pd.DataFrame):
+            report["entity_rows"] = len(self.entity_df)
+            report["entity_df_bytes"] = int(self.entity_df.memory_usage(deep=True).sum())
+        else:
+            report["entity_rows"] = None
+            report["entity_df_bytes"] = 0
+
+        table = self._bigquery().get_table(self.table)
+        report["result_table"] = self.table
+        report["result_rows"] = table.num_rows
+        report["result_columns"] = len(table.schema)
+        # BigQuery logical bytes are close to the Arrow in-memory size; pandas
+        # object columns (strings) can take several times more
+        report["result_bytes"] = table.num_bytes
+
+        if show:
+            print("\n" + "="*80)
+            print("FEAST HISTORICAL RETRIEVAL - MEMORY REPORT")
+            print("="*80)
+            entity_rows = report["entity_rows"]
+            print(f"  Entity rows:        {entity_rows if entity_rows is not None else 'SQL query'}")
+            print(f"  Entity DataFrame:   {_format_bytes(report['entity_df_bytes'])}")
+            print(f"  Result rows:        {report['result_rows']:,} x {report['result_columns']} columns")
+            print(f"  Result (Arrow):     ~{_format_bytes(report['result_bytes'])}")
+            print(f"  Result table:       {report['result_table']}")
+            print("="*80)
+        return report
+
+    def _download_storage(self, local_dir: Path) -> List[str]:
+        from deployml.scoring.sinks import ParquetSink
+        from deployml.scoring.sources import BigQuerySource
+
+        source = BigQuerySource(self.table, self.project_id, max_streams=self.max_workers)
+
+        def write(index_stream):
+            index, stream = index_stream
+            sink = ParquetSink(str(local_dir), prefix=f"stream-{index:03d}")
+            for batch in stream:
+                sink.write(batch)
+            return sink.close()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            shards = pool.map(write, enumerate(source.streams()))
+            return [path for paths in shards for path in paths]
+
+    def _download_export(self, local_dir: Path) -> List[str]:
+        from google.cloud import bigquery, storage
+
+        prefix = f"{self.staging_uri.rstrip('/')}/{uuid.uuid4().hex[:12]}"
+        job_config = bigquery.ExtractJobConfig(
+            destination_format=bigquery.DestinationFormat.PARQUET,
+            compression=bigquery.Compression.SNAPPY,
+        )
+        self._bigquery().extract_table(self.table, f"{prefix}/part-*.parquet", job_config=job_config).result()
+
+        bucket_name, _, blob_prefix = prefix[len("gs://"):].partition("/")
+        bucket = storage.Client(project=self.project_id or None).bucket(bucket_name)
+        blobs = list(bucket.list_blobs(prefix=blob_prefix))
+
+        def download(blob):
+            path = local_dir / Path(blob.name).name
+            blob.download_to_filename(str(path))
+            blob.delete()
+            return str(path)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(download, blobs))
+
+    def to_dataset(self):
+        """Download the result as Parquet shards and open them as a lazy Arrow dataset"""
+        if self._dataset is None:
+            import pyarrow.dataset as ds
+
+            if self.local_dir:
+                local_dir = Path(self.local_dir).resolve()
+            else:
+                local_dir = Path(tempfile.mkdtemp(prefix="deployml-feast-"))
+            local_dir.mkdir(parents=True, exist_ok=True)
+            started = time.perf_counter()
+            if self.method == "storage":
+                files = self._download_storage(local_dir)
+            else:
+                files = self._download_export(local_dir)
+            elapsed = time.perf_counter() - started
+            self._bigquery().delete_table(self._table, not_found_ok=True)
+            self._table = None
+            size = sum(os.path.getsize(path) for path in files)
+            print(f"Downloaded {len(files)} shard(s), {_format_bytes(size)} in {elapsed:.1f}s "
+                  f"({_format_bytes(size / elapsed if elapsed else 0)}/s) to {local_dir}")
+            self._dataset = ds.dataset(files, format="parquet")
+        return self._dataset
+
+    def to_arrow(self, columns: Optional[List[str]] = None, filter=None):
+        """Load the result (optionally a column subset / row filter) as an Arrow table"""
+        return self.to_dataset().to_table(columns=columns, filter=filter)
+
+    def to_df(self, columns: Optional[List[str]] = None, filter=None) -> pd.DataFrame:
+        """Load the result into pandas, converting column blocks without extra copies"""
+        return self.to_arrow(columns, filter).to_pandas(split_blocks=True, self_destruct=True)
+
+
+class FeastHelper:
+    """
+    Feast access for a deployed stack, focused on building training sets
+
+    Example:
+        retrieval = stack.feast.get_historical_features(entity_df, ["driver_stats:conv_rate"])
+        retrieval.memory_report()
+        dataset = retrieval.to_dataset()   # pyarrow.dataset, nothing loaded yet
+        df = retrieval.to_df()
+    """
+
+    def __init__(self, stack, repo_path: Optional[str] = None):
+        self.stack = stack
+        self.repo_path = repo_path
+        self._store = None
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        for stage in self.stack.config.get('stack', []):
+            for stage_name, tool in stage.items():
+                if stage_name == 'feature_store' and tool.get('name') == 'feast':
+                    return tool.get('params', {}) or {}
+        return {}
+
+    @property
+    def store(self):
+        """FeatureStore for the stack's feature repository
+
+        The repository is taken from `repo_path`, the stage's `repo_path`
+        param or FEAST_REPO_PATH, in that order.
+        """
+        if self._store is None:
+            repo_path = self.repo_path or self.params.get('repo_path') or os.getenv("FEAST_REPO_PATH")
+            if not repo_path:
+                raise RuntimeError(
+                    "No Feast repository configured. Pass repo_path, set the feature_store "
+                    "repo_path param or FEAST_REPO_PATH, or call use_store(store)."
+                )
+            try:
+                from feast import FeatureStore
+            except ImportError:
+                raise ImportError("Feast is not installed: pip install 'deployml-core[feast]'")
+            self._store = FeatureStore(repo_path=str(repo_path))
+        return self._store
+
+    def use_store(self, store) -> "FeastHelper":
+        """Use an existing FeatureStore instead of loading one from a repo path"""
+        self._store = store
+        return self
+
+    def get_historical_features(
+        self,
+        entity_df: Union[pd.DataFrame, str],
+        features: Union[List[str], Any],
+        method: str = "storage",
+        staging_uri: Optional[str] = None,
+        local_dir: Optional[str] = None,
+        max_workers: int = 8,
+        full_feature_names: bool = False,
+    ) -> HistoricalRetrieval:
+        """Start a historical retrieval without pulling rows into memory
+
+        Args:
+            entity_df: Entity DataFrame (with event_timestamp) or a BigQuery SQL query
+            features: Feature references or a FeatureService
+            method: "storage" (BigQuery Storage Read API) or "export" (Parquet export to GCS)
+            staging_uri: gs:// prefix for exported shards; defaults to the stack's artifact bucket
+            local_dir: Where to download shards; defaults to a temporary directory
+            max_workers: Parallel read streams / downloads
+            full_feature_names: Prefix feature columns with their feature view name
+        """
+        if isinstance(entity_df, pd.DataFrame):
+            print(f"Entity DataFrame: {len(entity_df):,} rows, "
+                  f"{_format_bytes(entity_df.memory_usage(deep=True).sum())} in memory")
+
+        store = self.store
+        if getattr(store.config.offline_store, "type", "") != "bigquery":
+            raise RuntimeError("Parallel historical retrieval needs the BigQuery offline store")
+        if method == "export" and not staging_uri:
+            bucket = self.stack.get_artifact_bucket()
+            staging_uri = f"gs://{bucket}/feast-exports" if bucket else None
+
+        job = store.get_historical_features(
+            entity_df=entity_df,
+            features=features,
+            full_feature_names=full_feature_names,
+        )
+        project_id = (
+            getattr(store.config.offline_store, "project_id", None)
+            or self.stack.provider.get('project_id', '')
+        )
+        return HistoricalRetrieval(job, entity_df, project_id, method, staging_uri, local_dir, max_workers)
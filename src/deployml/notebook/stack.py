@@ -1,13 +1,17 @@
 import json
 import subprocess
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import pandas as pd
 import mlflow
 from mlflow.tracking import MlflowClient
 
+from deployml.utils.data_push import find_artifact_bucket
+
 from .urls import ServiceURLs
 from .display import display_services_table
+from .feast import FeastHelper
 
 
 class DeploymentStack:
@@ -23,6 +27,7 @@ class DeploymentStack:
         self.provider = config.get('provider', {})
         self._urls = None
         self._mlflow_client = None
+        self._feast = None
         
     @property
     def urls(self) -> ServiceURLs:
@@ -94,6 +99,29 @@ class DeploymentStack:
                 raise RuntimeError("MLflow URL not available. Check deployment status.")
         return self._mlflow_client
     
+    @property
+    def feast(self) -> FeastHelper:
+        """Feast helper for historical feature retrieval"""
+        if self._feast is None:
+            self._feast = FeastHelper(self)
+        return self._feast
+    
+    def get_artifact_bucket(self) -> Optional[str]:
+        """Get the stack's artifact bucket name from Terraform outputs"""
+        try:
+            terraform_dir = self.workspace_dir / "terraform"
+            result = subprocess.run(
+                ["terraform", "output", "-json"],
+                cwd=terraform_dir,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            outputs = json.loads(result.stdout)
+        except Exception:
+            return None
+        return find_artifact_bucket(outputs)
+    
     def get_urls_dataframe(self) -> pd.DataFrame:
         """Get service URLs as a pandas DataFrame"""
         return self.urls.to_dataframe()
@@ -340,6 +368,52 @@ class DeploymentStack:
         except Exception as e:
             return {"error": f"Could not extract cron job info: {e}"}
     
+    def get_cron_job_executions(self, job_info: Dict[str, Any], limit: int = 5) -> List[Dict[str, Any]]:
+        """Get recent executions of a cron job from the Cloud Run API
+        
+        Terraform only records the job definition, so run history is read
+        with `gcloud run jobs executions list`.
+        
+        Args:
+            job_info: Entry from the cron jobs summary output
+            limit: Number of most recent executions to return
+        """
+        location = job_info.get('location') or self.provider.get('region', '')
+        project_id = job_info.get('project_id') or self.provider.get('project_id', '')
+        result = subprocess.run(
+            ["gcloud", "run", "jobs", "executions", "list",
+             "--job", job_info.get('service_name', ''),
+             "--region", location,
+             "--project", project_id,
+             "--limit", str(limit),
+             "--format", "json"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        
+        executions = []
+        for execution in json.loads(result.stdout or "[]"):
+            metadata = execution.get('metadata', {})
+            status = execution.get('status', {})
+            start = self._parse_timestamp(status.get('startTime'))
+            end = self._parse_timestamp(status.get('completionTime'))
+            executions.append({
+                'name': metadata.get('name', ''),
+                'started': start,
+                'duration_seconds': (end - start).total_seconds() if start and end else None,
+                'succeeded': status.get('succeededCount', 0),
+                'failed': status.get('failedCount', 0),
+                'running': status.get('runningCount', 0),
+            })
+        return executions
+    
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    
     def show_cron_jobs(self):
         """Display detailed cron job information"""
         info = self.get_cron_jobs_info()
@@ -361,14 +435,42 @@ class DeploymentStack:
                     print(f"  Image: {job_info.get('image', 'N/A')}")
                     if job_info.get('bigquery_dataset'):
                         print(f"  BigQuery Dataset: {job_info.get('bigquery_dataset')}")
+                    if 'task_count' in job_info:
+                        print(f"  Tasks: {job_info.get('task_count')} (parallelism {job_info.get('parallelism')}, "
+                              f"retries {job_info.get('max_retries')})")
+                        print(f"  Resources: {job_info.get('cpu')} CPU, {job_info.get('memory')} memory, "
+                              f"timeout {job_info.get('timeout')}")
                     print(f"  Console URL: {job_info.get('job_url', 'N/A')}")
                     if job_info.get('scheduler_name'):
                         print(f"  Scheduler: {job_info.get('scheduler_name')}")
+                    self._print_cron_executions(job_info)
         else:
             print("No cron jobs found in deployment")
             
         print("="*80)
     
+    def _print_cron_executions(self, job_info: Dict[str, Any], limit: int = 5):
+        """Print the duration and outcome of a job's recent executions"""
+        try:
+            executions = self.get_cron_job_executions(job_info, limit)
+        except Exception as e:
+            print(f"  Recent executions: unavailable ({e})")
+            return
+        
+        if not executions:
+            print("  Recent executions: none")
+            return
+        
+        print("  Recent executions:")
+        for execution in executions:
+            started = execution['started'].strftime('%Y-%m-%d %H:%M') if execution['started'] else 'pending'
+            if execution['duration_seconds'] is not None:
+                duration = f"{execution['duration_seconds'] / 60:.1f} min"
+            else:
+                duration = "running" if execution['running'] else "N/A"
+            outcome = f"{execution['succeeded']} ok / {execution['failed']} failed"
+            print(f"    {execution['name']}: {started}  {duration}  ({outcome})")
+    
     def show_status(self) -> None:
         """Show deployment status in professional format"""
         print("\n" + "="*80)
@@ -0,0 +1,35 @@
+"""
+DeployML Batch Scoring Runtime
+
+Streams a source table through an MLflow pyfunc model and writes the
+predictions back, for use inside offline_scoring and cron job images.
+Reads, predictions and writes run concurrently over bounded queues of
+Arrow record batches, so memory stays flat regardless of table size.
+
+Example usage (inside a job image):
+    python -m deployml.scoring        # configured through environment variables
+
+    from deployml.scoring import ScoringConfig, run_scoring
+    config = ScoringConfig(
+        model_uri="models:/house_price/latest",
+        source_path="data/features.parquet",
+        sink_path="out/predictions",
+        id_columns=["house_id"],
+    )
+    stats = run_scoring(config)
+"""
+
+from .config import ScoringConfig
+from .runner import ScoringStats, run_scoring
+from .sinks import BigQueryLoadSink, ParquetSink
+from .sources import BigQuerySource, ParquetSource
+
+__all__ = [
+    'ScoringConfig',
+    'ScoringStats',
+    'run_scoring',
+    'BigQuerySource',
+    'ParquetSource',
+    'BigQueryLoadSink',
+    'ParquetSink'
+]
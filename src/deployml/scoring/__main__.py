@@ -0,0 +1,24 @@
+import logging
+import sys
+
+from .config import ScoringConfig
+from .runner import run_scoring
+
+
+def main() -> int:
+    """Run one scoring task configured from environment variables."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    config = ScoringConfig.from_env()
+    try:
+        config.validate()
+        run_scoring(config)
+    except Exception as e:
+        logging.getLogger("deployml.scoring").error(f"Scoring failed: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import os
+from dataclasses import dataclass, field
+from typing import List
+
+
+def _env_list(name: str) -> List[str]:
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+@dataclass
+class ScoringConfig:
+    """Settings for one batch scoring run (one task of a sharded job)"""
+
+    model_uri: str
+    source_table: str = ""
+    source_path: str = ""
+    sink_table: str = ""
+    sink_path: str = ""
+    staging_uri: str = ""
+    project_id: str = ""
+    feature_columns: List[str] = field(default_factory=list)
+    id_columns: List[str] = field(default_factory=list)
+    prediction_column: str = "prediction"
+    row_filter: str = ""
+    batch_size: int = 10000
+    queue_depth: int = 4
+    predict_workers: int = 2
+    read_streams: int = 4
+    shard_index: int = 0
+    shard_count: int = 1
+    shard_strategy: str = "hash"
+    shard_partition_column: str = ""
+    shard_key_min: str = ""
+    shard_key_max: str = ""
+    run_id: str = ""
+
+    @classmethod
+    def from_env(cls) -> "ScoringConfig":
+        """
+        Build a config from the job's environment.
+
+        Uses the variables set by the offline_scoring module (MODEL_NAME,
+        MODEL_STAGE, BATCH_SIZE, SHARD_*, FEAST_OFFLINE_STORE_*) and the
+        execution id and task index/count Cloud Run provides, plus
+        SOURCE_*/SINK_* for the data.
+
+        Returns:
+            ScoringConfig: The configuration for this task.
+        """
+        model_uri = os.getenv("MODEL_URI", "")
+        if not model_uri and os.getenv("MODEL_NAME"):
+            model_uri = f"models:/{os.environ['MODEL_NAME']}/{os.getenv('MODEL_STAGE') or 'latest'}"
+
+        dataset = os.getenv("FEAST_OFFLINE_STORE_DATASET", "")
+
+        def qualify(table: str) -> str:
+            # Bare table names live in the offline store dataset
+            return f"{dataset}.{table}" if table and "." not in table and dataset else table
+
+        return cls(
+            model_uri=model_uri,
+            source_table=qualify(os.getenv("SOURCE_TABLE", "")),
+            source_path=os.getenv("SOURCE_PATH", ""),
+            sink_table=qualify(os.getenv("SINK_TABLE", "")),
+            sink_path=os.getenv("SINK_PATH", ""),
+            staging_uri=os.getenv("STAGING_URI", ""),
+            project_id=os.getenv("GOOGLE_CLOUD_PROJECT")
+            or os.getenv("FEAST_OFFLINE_STORE_PROJECT_ID", ""),
+            feature_columns=_env_list("FEATURE_COLUMNS"),
+            id_columns=_env_list("ID_COLUMNS"),
+            prediction_column=os.getenv("PREDICTION_COLUMN", "prediction"),
+            row_filter=os.getenv("ROW_FILTER", ""),
+            batch_size=int(os.getenv("BATCH_SIZE") or 10000),
+            queue_depth=int(os.getenv("QUEUE_DEPTH") or 4),
+            predict_workers=int(os.getenv("PREDICT_WORKERS") or 2),
+            read_streams=int(os.getenv("READ_STREAMS") or 4),
+            shard_index=int(os.getenv("CLOUD_RUN_TASK_INDEX") or 0),
+            shard_count=int(
+                os.getenv("CLOUD_RUN_TASK_COUNT") or os.getenv("SHARD_COUNT") or 1
+            ),
+            shard_strategy=os.getenv("SHARD_STRATEGY", "hash"),
+            shard_partition_column=os.getenv("SHARD_PARTITION_COLUMN", ""),
+            shard_key_min=os.getenv("SHARD_KEY_MIN", ""),
+            shard_key_max=os.getenv("SHARD_KEY_MAX", ""),
+            run_id=os.getenv("CLOUD_RUN_EXECUTION", ""),
+        )
+
+    def validate(self, require_model: bool = True) -> None:
+        """
+        Check that the config describes a runnable job.
+
+        Args:
+            require_model (bool): Whether a model URI must be configured.
+
+        Raises:
+            ValueError: If a required setting is missing or inconsistent.
+        """
+        if require_model and not self.model_uri:
+            raise ValueError("MODEL_URI or MODEL_NAME must be set")
+        if bool(self.source_table) == bool(self.source_path):
+            raise ValueError("set exactly one of SOURCE_TABLE or SOURCE_PATH")
+        if bool(self.sink_table) == bool(self.sink_path):
+            raise ValueError("set exactly one of SINK_TABLE or SINK_PATH")
+        if self.sink_table and not self.staging_uri.startswith("gs://"):
+            raise ValueError("SINK_TABLE needs STAGING_URI (gs://bucket/prefix) for load jobs")
+        if self.sink_table and not self.id_columns:
+            raise ValueError("SINK_TABLE needs ID_COLUMNS to merge predictions on")
+        if self.source_path and self.row_filter:
+            raise ValueError("ROW_FILTER is only supported for BigQuery sources")
+        if self.shard_count > 1:
+            if not self.shard_partition_column:
+                raise ValueError("SHARD_PARTITION_COLUMN is required when running more than one task")
+            if self.shard_strategy not in ("hash", "range"):
+                raise ValueError("SHARD_STRATEGY must be hash or range")
+            if self.shard_strategy == "range" and not (self.shard_key_min and self.shard_key_max):
+                raise ValueError("range sharding needs SHARD_KEY_MIN and SHARD_KEY_MAX")
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(f"task index {self.shard_index} outside shard count {self.shard_count}")
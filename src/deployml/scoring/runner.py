@@ -0,0 +1,240 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .config import ScoringConfig
+from .sharding import hash_mask
+from .sinks import BigQueryLoadSink, ParquetSink
+from .sources import BigQuerySource, ParquetSource
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class ScoringStats:
+    """Counters for one scoring run"""
+
+    rows_read: int = 0
+    rows_written: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def load_model(model_uri: str):
+    """Load an MLflow pyfunc model."""
+    import mlflow.pyfunc
+
+    return mlflow.pyfunc.load_model(model_uri)
+
+
+def predictions_to_columns(predictions, prediction_column: str) -> dict:
+    """
+    Convert model output to named Arrow columns.
+
+    DataFrames keep their column names; 2-D arrays become
+    `<prediction_column>_<i>`; anything else is one column.
+    """
+    if isinstance(predictions, pd.DataFrame):
+        return {str(name): pa.array(predictions[name].to_numpy()) for name in predictions.columns}
+    if isinstance(predictions, pd.Series):
+        predictions = predictions.to_numpy()
+    predictions = np.asarray(predictions)
+    if predictions.ndim == 2:
+        return {
+            f"{prediction_column}_{i}": pa.array(predictions[:, i])
+            for i in range(predictions.shape[1])
+        }
+    return {prediction_column: pa.array(predictions)}
+
+
+def score_batch(model, batch: pa.RecordBatch, config: ScoringConfig) -> pa.RecordBatch:
+    """Predict one record batch and return id columns plus predictions."""
+    feature_columns = config.feature_columns or [
+        name for name in batch.schema.names if name not in config.id_columns
+    ]
+    features = batch.select(feature_columns).to_pandas(split_blocks=True)
+    columns = {name: batch.column(name) for name in config.id_columns}
+    columns.update(predictions_to_columns(model.predict(features), config.prediction_column))
+    return pa.RecordBatch.from_pydict(columns)
+
+
+def _slices(batch: pa.RecordBatch, batch_size: int) -> Iterable[pa.RecordBatch]:
+    for offset in range(0, batch.num_rows, batch_size):
+        yield batch.slice(offset, batch_size)
+
+
+def build_source(config: ScoringConfig):
+    columns = None
+    if config.feature_columns:
+        columns = list(dict.fromkeys(config.id_columns + config.feature_columns))
+        if config.shard_partition_column and config.shard_partition_column not in columns:
+            columns.append(config.shard_partition_column)
+    if config.source_table:
+        return BigQuerySource.from_config(config, columns)
+    return ParquetSource.from_config(config, columns)
+
+
+def build_sink(config: ScoringConfig):
+    if config.sink_table:
+        return BigQueryLoadSink(
+            config.sink_table,
+            config.staging_uri,
+            config.project_id,
+            config.id_columns,
+            config.shard_index,
+            config.run_id,
+        )
+    return ParquetSink(config.sink_path, prefix=f"part-{config.shard_index:05d}")
+
+
+def run_scoring(
+    config: ScoringConfig,
+    model=None,
+    source=None,
+    sink=None,
+) -> ScoringStats:
+    """
+    Score a source into a sink with overlapping reads, predictions and writes.
+
+    Reader threads (one per source stream) slice record batches to
+    `batch_size` rows and apply hash sharding; `predict_workers` threads run
+    the model; the calling thread writes results. Both hand-offs are bounded
+    queues of `queue_depth` batches, which caps memory use.
+
+    Args:
+        config (ScoringConfig): Run settings.
+        model: Object with `predict(DataFrame)`; loaded from `config.model_uri` if None.
+        source: Object with `streams()`; built from the config if None.
+        sink: Object with `write(batch)` and `close()`; built from the config if None.
+
+    Returns:
+        ScoringStats: Rows read and written, batches and elapsed time.
+
+    Raises:
+        Exception: The first error raised by any reader, predictor or writer.
+    """
+    if model is None or source is None or sink is None:
+        config.validate(require_model=model is None)
+    if model is None:
+        model = load_model(config.model_uri)
+    source = source or build_source(config)
+    sink = sink or build_sink(config)
+
+    stats = ScoringStats()
+    stats_lock = threading.Lock()
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    to_predict: queue.Queue = queue.Queue(maxsize=config.queue_depth)
+    to_write: queue.Queue = queue.Queue(maxsize=config.queue_depth)
+
+    def fail(error: BaseException):
+        errors.append(error)
+        stop.set()
+
+    def put(target: queue.Queue, item) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(source_queue: queue.Queue):
+        while not stop.is_set():
+            try:
+                return source_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def read(stream):
+        try:
+            for batch in stream:
+                for piece in _slices(batch, config.batch_size):
+                    mask = hash_mask(piece, config)
+                    if mask is not None:
+                        piece = piece.filter(mask)
+                    if piece.num_rows == 0:
+                        continue
+                    with stats_lock:
+                        stats.rows_read += piece.num_rows
+                    if not put(to_predict, piece):
+                        return
+        except BaseException as e:
+            fail(e)
+
+    def predict():
+        try:
+            while True:
+                batch = get(to_predict)
+                if batch is _DONE:
+                    return
+                if not put(to_write, score_batch(model, batch, config)):
+                    return
+        except BaseException as e:
+            fail(e)
+
+    def supervise(readers: List[threading.Thread], predictors: List[threading.Thread]):
+        for thread in readers:
+            thread.join()
+        for _ in predictors:
+            put(to_predict, _DONE)
+        for thread in predictors:
+            thread.join()
+        put(to_write, _DONE)
+
+    started = time.perf_counter()
+    readers = [
+        threading.Thread(target=read, args=(stream,), daemon=True)
+        for stream in source.streams()
+    ]
+    predictors = [
+        threading.Thread(target=predict, daemon=True)
+        for _ in range(max(1, config.predict_workers))
+    ]
+    supervisor = threading.Thread(
+        target=supervise, args=(readers, predictors), daemon=True
+    )
+    for thread in readers + predictors + [supervisor]:
+        thread.start()
+    logger.info(
+        f"Scoring shard {config.shard_index + 1}/{config.shard_count}: "
+        f"{len(readers)} read stream(s), {len(predictors)} predict worker(s)"
+    )
+
+    try:
+        while True:
+            batch = get(to_write)
+            if batch is _DONE:
+                break
+            sink.write(batch)
+            stats.rows_written += batch.num_rows
+            stats.batches += 1
+    except BaseException as e:
+        fail(e)
+
+    supervisor.join(timeout=5)
+    if errors:
+        raise errors[0]
+    sink.close()
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        f"Scored {stats.rows_written} rows in {stats.elapsed_seconds:.1f}s "
+        f"({stats.rows_per_second:.0f} rows/s)"
+    )
+    return stats
@@ -0,0 +1,64 @@
+from typing import Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .config import ScoringConfig
+
+Number = Union[int, float]
+
+
+def _parse_key(value: str) -> Number:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def range_bounds(config: ScoringConfig) -> Optional[Tuple[Number, Number]]:
+    """
+    Key range [low, high) scored by this task under range sharding.
+
+    Returns:
+        Optional[Tuple]: (low, high), or None when not range sharding.
+    """
+    if config.shard_count <= 1 or config.shard_strategy != "range":
+        return None
+    key_min = _parse_key(config.shard_key_min)
+    key_max = _parse_key(config.shard_key_max)
+    width = (key_max - key_min) / config.shard_count
+    low = key_min + width * config.shard_index
+    high = key_min + width * (config.shard_index + 1)
+    if isinstance(key_min, int) and isinstance(key_max, int):
+        low, high = int(low), int(high)
+    if config.shard_index == config.shard_count - 1:
+        high = key_max
+    return low, high
+
+
+def range_restriction(config: ScoringConfig) -> str:
+    """SQL predicate selecting this task's key range (empty if not range sharding)."""
+    bounds = range_bounds(config)
+    if bounds is None:
+        return ""
+    low, high = bounds
+    column = config.shard_partition_column
+    return f"{column} >= {low} AND {column} < {high}"
+
+
+def hash_mask(batch: pa.RecordBatch, config: ScoringConfig) -> Optional[pa.Array]:
+    """
+    Boolean mask of the rows this task owns under hash sharding.
+
+    Rows are assigned by a stable hash of the partition column, so every task
+    sees the same assignment. The filter runs after reading; prefer range
+    sharding when the source should be pruned at read time.
+
+    Returns:
+        Optional[pa.Array]: Mask, or None when not hash sharding.
+    """
+    if config.shard_count <= 1 or config.shard_strategy != "hash":
+        return None
+    keys = batch.column(config.shard_partition_column).to_pandas()
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return pa.array(hashes % config.shard_count == config.shard_index)
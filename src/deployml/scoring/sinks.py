@@ -0,0 +1,144 @@
+import os
+import re
+import uuid
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+
+class ParquetSink:
+    """
+    Writes record batches to Parquet part files under a directory or gs:// prefix.
+
+    Files roll over every `rows_per_file` rows so that each stays a
+    reasonable size for downstream load jobs.
+    """
+
+    def __init__(self, path: str, prefix: str = "part", rows_per_file: int = 1_000_000):
+        if "://" in path:
+            self.filesystem, self.base = fs.FileSystem.from_uri(path)
+        else:
+            # from_uri only accepts absolute local paths
+            self.filesystem, self.base = fs.LocalFileSystem(), os.path.abspath(path)
+        self.uri = path.rstrip("/")
+        self.prefix = prefix
+        self.rows_per_file = rows_per_file
+        self.files: List[str] = []
+        self.rows_written = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._rows_in_file = 0
+        self.filesystem.create_dir(self.base, recursive=True)
+
+    def _open(self, schema: pa.Schema):
+        name = f"{self.prefix}-{len(self.files):05d}.parquet"
+        self._writer = pq.ParquetWriter(
+            f"{self.base}/{name}", schema, filesystem=self.filesystem, compression="zstd"
+        )
+        self.files.append(f"{self.uri}/{name}")
+        self._rows_in_file = 0
+
+    def write(self, batch: pa.RecordBatch):
+        if self._writer is None:
+            self._open(batch.schema)
+        self._writer.write_batch(batch)
+        self._rows_in_file += batch.num_rows
+        self.rows_written += batch.num_rows
+        if self._rows_in_file >= self.rows_per_file:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> List[str]:
+        """Finish the current file; returns the URIs of all files written."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return self.files
+
+
+class BigQueryLoadSink:
+    """
+    Loads predictions into BigQuery by staging Parquet on GCS.
+
+    Batches are written as Parquet part files under a staging prefix derived
+    from the execution id and task index. `close` loads them into a per-task
+    staging table (a free load job, much faster than streaming inserts) and
+    merges that into the destination on `id_columns`, so a retried task
+    replaces its earlier rows instead of appending them twice.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        staging_uri: str,
+        project_id: str,
+        id_columns: List[str],
+        task_index: int = 0,
+        run_id: str = "",
+    ):
+        if not id_columns:
+            raise ValueError("BigQuery sinks need id columns to merge predictions on")
+        self.table = table
+        self.project_id = project_id
+        self.id_columns = id_columns
+        run_id = run_id or uuid.uuid4().hex[:12]
+        self.staging_prefix = f"{staging_uri.rstrip('/')}/{run_id}/task-{task_index:05d}"
+        suffix = re.sub(r"\W", "_", run_id)
+        self.staging_table = f"{self._qualified(table)}__staging_{suffix}_{task_index:05d}"
+        self.parquet = ParquetSink(self.staging_prefix)
+        # Drop part files left by an earlier attempt of this task
+        self.parquet.filesystem.delete_dir_contents(self.parquet.base, missing_dir_ok=True)
+
+    def _qualified(self, table: str) -> str:
+        parts = table.split(".")
+        if len(parts) == 2 and self.project_id:
+            parts = [self.project_id] + parts
+        if len(parts) != 3:
+            raise ValueError(f"BigQuery table must be project.dataset.table: {table}")
+        return ".".join(parts)
+
+    @property
+    def rows_written(self) -> int:
+        return self.parquet.rows_written
+
+    def write(self, batch: pa.RecordBatch):
+        self.parquet.write(batch)
+
+    def merge_query(self, columns: List[str]) -> str:
+        """MERGE statement upserting the staging table into the destination."""
+        on = " AND ".join(f"T.`{name}` = S.`{name}`" for name in self.id_columns)
+        values = [name for name in columns if name not in self.id_columns]
+        query = f"MERGE `{self._qualified(self.table)}` T USING `{self.staging_table}` S ON {on}"
+        if values:
+            updates = ", ".join(f"`{name}` = S.`{name}`" for name in values)
+            query += f" WHEN MATCHED THEN UPDATE SET {updates}"
+        return query + " WHEN NOT MATCHED THEN INSERT ROW"
+
+    def close(self) -> List[str]:
+        files = self.parquet.close()
+        if not files:
+            return files
+        try:
+            from google.cloud import bigquery
+        except ImportError:
+            raise ImportError(
+                "BigQuery sinks need google-cloud-bigquery: pip install 'deployml-core[scoring]'"
+            )
+
+        client = bigquery.Client(project=self.project_id or None)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition="WRITE_TRUNCATE",
+        )
+        client.load_table_from_uri(
+            f"{self.staging_prefix}/*.parquet", self.staging_table, job_config=job_config
+        ).result()
+
+        staged = client.get_table(self.staging_table)
+        client.create_table(
+            bigquery.Table(self._qualified(self.table), schema=staged.schema), exists_ok=True
+        )
+        client.query(self.merge_query([field.name for field in staged.schema])).result()
+        client.delete_table(self.staging_table, not_found_ok=True)
+        return files
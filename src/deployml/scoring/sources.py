@@ -0,0 +1,115 @@
+from typing import Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .config import ScoringConfig
+from .sharding import range_bounds, range_restriction
+
+
+class ParquetSource:
+    """Parquet files (local path or gs:// URI) read as Arrow record batches"""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[List[str]] = None,
+        filter: Optional[ds.Expression] = None,
+        batch_size: int = 10000,
+    ):
+        self.path = path
+        self.columns = columns
+        self.filter = filter
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_config(cls, config: ScoringConfig, columns: Optional[List[str]]) -> "ParquetSource":
+        bounds = range_bounds(config)
+        expression = None
+        if bounds is not None:
+            column = ds.field(config.shard_partition_column)
+            expression = (column >= bounds[0]) & (column < bounds[1])
+        return cls(config.source_path, columns, expression, config.batch_size)
+
+    def streams(self) -> List[Iterable[pa.RecordBatch]]:
+        """A single stream; pyarrow already reads fragments in parallel."""
+        dataset = ds.dataset(self.path, format="parquet")
+        return [
+            dataset.to_batches(
+                columns=self.columns, filter=self.filter, batch_size=self.batch_size
+            )
+        ]
+
+
+class BigQuerySource:
+    """
+    BigQuery table read through the Storage Read API as Arrow record batches.
+
+    The read session is split into several streams that are consumed in
+    parallel; column selection and the row restriction are applied server-side.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        row_restriction: str = "",
+        max_streams: int = 4,
+    ):
+        self.table = table
+        self.project_id = project_id
+        self.columns = columns
+        self.row_restriction = row_restriction
+        self.max_streams = max_streams
+
+    @classmethod
+    def from_config(cls, config: ScoringConfig, columns: Optional[List[str]]) -> "BigQuerySource":
+        restrictions = [r for r in (config.row_filter, range_restriction(config)) if r]
+        return cls(
+            config.source_table,
+            config.project_id,
+            columns,
+            " AND ".join(f"({r})" for r in restrictions),
+            config.read_streams,
+        )
+
+    def _table_path(self) -> str:
+        parts = self.table.split(".")
+        if len(parts) == 2:
+            parts = [self.project_id] + parts
+        if len(parts) != 3 or not parts[0]:
+            raise ValueError(f"BigQuery table must be project.dataset.table: {self.table}")
+        project, dataset, table = parts
+        return f"projects/{project}/datasets/{dataset}/tables/{table}"
+
+    def streams(self) -> List[Iterable[pa.RecordBatch]]:
+        try:
+            from google.cloud import bigquery_storage
+            from google.cloud.bigquery_storage import types
+        except ImportError:
+            raise ImportError(
+                "BigQuery sources need google-cloud-bigquery-storage: pip install 'deployml-core[scoring]'"
+            )
+
+        client = bigquery_storage.BigQueryReadClient()
+        read_options = types.ReadSession.TableReadOptions(
+            selected_fields=self.columns or [],
+            row_restriction=self.row_restriction,
+        )
+        session = client.create_read_session(
+            parent=f"projects/{self.project_id}",
+            read_session=types.ReadSession(
+                table=self._table_path(),
+                data_format=types.DataFormat.ARROW,
+                read_options=read_options,
+            ),
+            max_stream_count=self.max_streams,
+        )
+
+        def read(stream_name: str) -> Iterator[pa.RecordBatch]:
+            reader = client.read_rows(stream_name)
+            for page in reader.rows(session).pages:
+                yield page.to_arrow()
+
+        return [read(stream.name) for stream in session.streams]
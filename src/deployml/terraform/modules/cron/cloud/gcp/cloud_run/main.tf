@@ -20,11 +20,12 @@ resource "google_cloud_run_v2_job" "scheduled_jobs" {
   depends_on = [google_project_service.required]
 
   template {
-    task_count  = 1
-    parallelism = 1
+    task_count  = each.value.task_count
+    parallelism = each.value.parallelism
     
     template {
-      max_retries     = 3
+      max_retries     = each.value.max_retries
+      timeout         = each.value.timeout
       service_account = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
       
       containers {
@@ -50,6 +51,32 @@ resource "google_cloud_run_v2_job" "scheduled_jobs" {
           }
         }
         
+        # Shard settings: each task scores a disjoint slice of the source.
+        # Cloud Run sets CLOUD_RUN_TASK_INDEX and CLOUD_RUN_TASK_COUNT per task.
+        env {
+          name  = "SHARD_COUNT"
+          value = tostring(each.value.task_count)
+        }
+        
+        env {
+          name  = "SHARD_STRATEGY"
+          value = each.value.shard_strategy
+        }
+        
+        dynamic "env" {
+          for_each = {
+            for name, value in {
+              SHARD_PARTITION_COLUMN = each.value.shard_partition_column
+              SHARD_KEY_MIN          = each.value.shard_key_min
+              SHARD_KEY_MAX          = each.value.shard_key_max
+            } : name => value if value != ""
+          }
+          content {
+            name  = env.key
+            value = env.value
+          }
+        }
+        
         # Feast-specific environment variables for offline scoring
         dynamic "env" {
           for_each = can(each.value.bigquery_dataset) && contains(["offline-scoring"], each.value.service_name) ? [1] : []
@@ -163,8 +190,8 @@ resource "google_cloud_run_v2_job" "scheduled_jobs" {
         
         resources {
           limits = {
-            cpu    = var.cpu_limit
-            memory = var.memory_limit
+            cpu    = each.value.cpu != "" ? each.value.cpu : var.cpu_limit
+            memory = each.value.memory != "" ? each.value.memory : var.memory_limit
           }
         }
       }
@@ -32,7 +32,25 @@ output "jobs_summary" {
     image          = job.image
     cron_schedule  = job.cron_schedule
     bigquery_dataset = try(job.bigquery_dataset, "")
+    task_count     = job.task_count
+    parallelism    = job.parallelism
+    cpu            = job.cpu != "" ? job.cpu : var.cpu_limit
+    memory         = job.memory != "" ? job.memory : var.memory_limit
+    timeout        = job.timeout
+    max_retries    = job.max_retries
+    job_id         = try(google_cloud_run_v2_job.scheduled_jobs[job.service_name].id, "")
+    location       = try(google_cloud_run_v2_job.scheduled_jobs[job.service_name].location, "")
+    project_id     = var.project_id
     job_url        = "https://console.cloud.google.com/run/jobs/details/${try(google_cloud_run_v2_job.scheduled_jobs[job.service_name].location, "")}/${try(google_cloud_run_v2_job.scheduled_jobs[job.service_name].name, "")}"
     scheduler_name = try(google_cloud_scheduler_job.scheduled_cron_jobs[job.service_name].name, "")
   }}
-}
\ No newline at end of file
+}
+
+# Terraform only knows the job definitions; run history is read from the
+# Cloud Run API (e.g. DeploymentStack.show_cron_jobs) using these identifiers.
+output "execution_history_commands" {
+  description = "gcloud commands listing recent executions of each job"
+  value = { for key, job in google_cloud_run_v2_job.scheduled_jobs : key =>
+    "gcloud run jobs executions list --job ${job.name} --region ${job.location} --project ${var.project_id} --limit 5"
+  }
+}
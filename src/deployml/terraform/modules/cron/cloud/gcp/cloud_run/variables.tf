@@ -18,6 +18,18 @@ variable "jobs" {
     image           = string
     cron_schedule   = string
     bigquery_dataset = optional(string, "")
+    # Per-job execution settings; empty cpu/memory fall back to cpu_limit/memory_limit
+    task_count      = optional(number, 1)
+    parallelism     = optional(number, 1)
+    cpu             = optional(string, "")
+    memory          = optional(string, "")
+    timeout         = optional(string, "600s")
+    max_retries     = optional(number, 3)
+    # Sharding for jobs running `python -m deployml.scoring` with task_count > 1
+    shard_strategy         = optional(string, "hash")
+    shard_partition_column = optional(string, "")
+    shard_key_min          = optional(string, "")
+    shard_key_max          = optional(string, "")
   }))
   default = []
 }
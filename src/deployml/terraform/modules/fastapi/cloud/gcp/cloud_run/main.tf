@@ -1,5 +1,17 @@
 data "google_project" "current" {}
 
+locals {
+  # Scaling and cold-start annotations driven by var.performance
+  performance_annotations = merge({
+    "autoscaling.knative.dev/minScale"      = tostring(var.performance.min_instances)
+    "autoscaling.knative.dev/maxScale"      = tostring(var.performance.max_instances)
+    "run.googleapis.com/cpu-throttling"     = var.performance.cpu_always_allocated ? "false" : "true"
+    "run.googleapis.com/startup-cpu-boost"  = tostring(var.performance.cpu_boost)
+  }, var.performance.gen2 ? {
+    "run.googleapis.com/execution-environment" = "gen2"
+  } : {})
+}
+
 resource "google_cloud_run_service" "fastapi" {
   name     = var.service_name
   location = var.region
@@ -7,16 +19,14 @@ resource "google_cloud_run_service" "fastapi" {
 
   template {
     metadata {
-      annotations = merge({
-        "autoscaling.knative.dev/maxScale" = "10"
-        "run.googleapis.com/cpu-throttling" = "false"
-        "run.googleapis.com/execution-environment" = "gen2"
-      }, var.use_postgres && var.cloudsql_instance_annotation != "" ? {
+      annotations = merge(local.performance_annotations, var.use_postgres && var.cloudsql_instance_annotation != "" ? {
         "run.googleapis.com/cloudsql-instances" = var.cloudsql_instance_annotation
       } : {})
     }
     spec {
-      service_account_name = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
+      service_account_name  = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
+      container_concurrency = var.performance.container_concurrency
+      timeout_seconds       = var.performance.timeout_seconds
       containers {
         image = var.image
         env {
@@ -61,27 +71,33 @@ resource "google_cloud_run_service" "fastapi" {
           container_port = 8080
         }
         
-        # Health check
-        liveness_probe {
-          http_get {
-            path = "/health"
-            port = 8080
+        # HTTP health checks, only when the image serves the configured paths
+        dynamic "liveness_probe" {
+          for_each = var.liveness_probe_path != "" ? [1] : []
+          content {
+            http_get {
+              path = var.liveness_probe_path
+              port = 8080
+            }
+            initial_delay_seconds = 30
+            timeout_seconds = 10
+            period_seconds = 30
+            failure_threshold = 3
           }
-          initial_delay_seconds = 30
-          timeout_seconds = 10
-          period_seconds = 30
-          failure_threshold = 3
         }
         
-        startup_probe {
-          http_get {
-            path = "/health"
-            port = 8080
+        dynamic "startup_probe" {
+          for_each = var.startup_probe_path != "" ? [1] : []
+          content {
+            http_get {
+              path = var.startup_probe_path
+              port = 8080
+            }
+            initial_delay_seconds = 10
+            timeout_seconds = 10
+            period_seconds = 10
+            failure_threshold = 10
           }
-          initial_delay_seconds = 10
-          timeout_seconds = 10
-          period_seconds = 10
-          failure_threshold = 10
         }
       }
     }
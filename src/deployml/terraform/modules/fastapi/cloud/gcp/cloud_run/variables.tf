@@ -93,4 +93,30 @@ variable "mlflow_bucket_exists" {
   type        = bool
   description = "Whether the MLflow artifact bucket already exists"
   default     = false
-} 
\ No newline at end of file
+} 
+
+variable "liveness_probe_path" {
+  type        = string
+  description = "HTTP path for the liveness probe; empty disables it. The image must serve this path (e.g. /health/live)"
+  default     = ""
+}
+
+variable "startup_probe_path" {
+  type        = string
+  description = "HTTP path for the startup probe; empty keeps Cloud Run's default TCP startup check. The image must serve this path (e.g. /health/ready)"
+  default     = ""
+}
+
+variable "performance" {
+  description = "Scaling and cold-start settings from the stage's performance block; unset fields keep the module defaults"
+  type = object({
+    min_instances         = optional(number, 0)
+    max_instances         = optional(number, 10)
+    container_concurrency = optional(number, 80)
+    cpu_boost             = optional(bool, false)
+    cpu_always_allocated  = optional(bool, true)
+    timeout_seconds       = optional(number, 300)
+    gen2                  = optional(bool, true)
+  })
+  default = {}
+}
@@ -1,5 +1,19 @@
 data "google_project" "current" {}
 
+locals {
+  online_store_type = var.online_store != "" ? var.online_store : (var.use_postgres ? "postgres" : "sqlite")
+
+  # Scaling and cold-start annotations driven by var.performance
+  performance_annotations = merge({
+    "autoscaling.knative.dev/minScale"      = tostring(var.performance.min_instances)
+    "autoscaling.knative.dev/maxScale"      = tostring(coalesce(var.performance.max_instances, var.max_scale))
+    "run.googleapis.com/cpu-throttling"     = var.performance.cpu_always_allocated ? "false" : "true"
+    "run.googleapis.com/startup-cpu-boost"  = tostring(var.performance.cpu_boost)
+  }, var.performance.gen2 ? {
+    "run.googleapis.com/execution-environment" = "gen2"
+  } : {})
+}
+
 resource "google_cloud_run_service" "feast" {
   name     = var.service_name
   location = var.region
@@ -7,22 +21,20 @@ resource "google_cloud_run_service" "feast" {
 
   template {
     metadata {
-      annotations = var.use_postgres && var.cloudsql_instance_annotation != "" ? {
-        "autoscaling.knative.dev/maxScale" = var.max_scale
-        "run.googleapis.com/cloudsql-instances" = var.cloudsql_instance_annotation
-        "run.googleapis.com/execution-environment" = "gen2"
+      annotations = merge(local.performance_annotations, {
         "run.googleapis.com/memory" = var.memory_limit
         "run.googleapis.com/cpu" = var.cpu_limit
-      } : {
-        "autoscaling.knative.dev/maxScale" = var.max_scale
-        "run.googleapis.com/execution-environment" = "gen2"
-        "run.googleapis.com/memory" = var.memory_limit
-        "run.googleapis.com/cpu" = var.cpu_limit
-      }
+      }, var.use_postgres && var.cloudsql_instance_annotation != "" ? {
+        "run.googleapis.com/cloudsql-instances" = var.cloudsql_instance_annotation
+      } : {}, var.vpc_connector != "" ? {
+        "run.googleapis.com/vpc-access-connector" = var.vpc_connector
+        "run.googleapis.com/vpc-access-egress"    = "private-ranges-only"
+      } : {})
     }
     spec {
       service_account_name = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
-      container_concurrency = var.container_concurrency
+      container_concurrency = coalesce(var.performance.container_concurrency, var.container_concurrency)
+      timeout_seconds       = var.performance.timeout_seconds
       containers {
         image = var.image
         
@@ -38,7 +50,24 @@ resource "google_cloud_run_service" "feast" {
         
         env {
           name  = "FEAST_ONLINE_STORE_TYPE"
-          value = var.use_postgres ? "postgres" : "sqlite"
+          value = local.online_store_type
+        }
+        
+        # External Redis online store (e.g. Memorystore reached through var.vpc_connector)
+        dynamic "env" {
+          for_each = local.online_store_type == "redis" ? [1] : []
+          content {
+            name  = "FEAST_REDIS_CONNECTION_STRING"
+            value = var.redis_connection_string
+          }
+        }
+        
+        dynamic "env" {
+          for_each = local.online_store_type == "redis" && var.redis_key_ttl_seconds > 0 ? [1] : []
+          content {
+            name  = "FEAST_REDIS_KEY_TTL_SECONDS"
+            value = tostring(var.redis_key_ttl_seconds)
+          }
         }
         
         env {
@@ -147,6 +176,13 @@ resource "google_cloud_run_service" "feast" {
     latest_revision = true
   }
   
+  lifecycle {
+    precondition {
+      condition     = local.online_store_type != "redis" || var.redis_connection_string != ""
+      error_message = "online_store = \"redis\" requires redis_connection_string."
+    }
+  }
+  
   depends_on = [
     google_project_service.feast_apis
   ]
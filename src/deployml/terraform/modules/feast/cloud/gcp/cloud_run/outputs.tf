@@ -23,12 +23,15 @@ output "feast_registry_uri" {
 }
 
 output "feast_online_store_config" {
-  value = {
-    type     = "postgres"
-    host     = var.postgres_host
-    port     = var.postgres_port
-    database = var.postgres_database
-    user     = var.postgres_user
+  value = local.online_store_type == "redis" ? {
+    type              = "redis"
+    connection_string = var.redis_connection_string
+  } : {
+    type              = "postgres"
+    host              = var.postgres_host
+    port              = var.postgres_port
+    database          = var.postgres_database
+    user              = var.postgres_user
   }
   sensitive = true
 }
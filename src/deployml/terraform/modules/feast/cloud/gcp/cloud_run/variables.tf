@@ -136,4 +136,46 @@ variable "bigquery_project" {
   type        = string
   description = "BigQuery project ID for offline store (defaults to main project_id if not specified)"
   default     = ""
-}
\ No newline at end of file
+}
+variable "online_store" {
+  type        = string
+  description = "Online store type (postgres, sqlite or redis); empty derives it from use_postgres"
+  default     = ""
+  validation {
+    condition     = contains(["", "postgres", "sqlite", "redis"], var.online_store)
+    error_message = "online_store must be postgres, sqlite or redis."
+  }
+}
+
+variable "redis_connection_string" {
+  type        = string
+  description = "Feast Redis connection string for an external Redis, e.g. 10.0.0.3:6379 or host:6379,password=...,ssl=true"
+  default     = ""
+  sensitive   = true
+}
+
+variable "redis_key_ttl_seconds" {
+  type        = number
+  description = "TTL for online store keys in Redis; 0 keeps them until evicted"
+  default     = 0
+}
+
+variable "vpc_connector" {
+  type        = string
+  description = "Serverless VPC Access connector used to reach a private Redis instance"
+  default     = ""
+}
+
+variable "performance" {
+  description = "Scaling and cold-start settings from the stage's performance block; unset fields keep the module defaults"
+  type = object({
+    min_instances         = optional(number, 0)
+    max_instances         = optional(number)
+    container_concurrency = optional(number)
+    cpu_boost             = optional(bool, false)
+    cpu_always_allocated  = optional(bool, false)
+    timeout_seconds       = optional(number, 300)
+    gen2                  = optional(bool, true)
+  })
+  default = {}
+}
@@ -2,7 +2,10 @@
 # Database Configuration
 FEAST_REGISTRY_TYPE=${use_postgres ? "sql" : "file"}
 FEAST_REGISTRY_PATH=${use_postgres ? backend_store_uri : "data/registry.db"}
-FEAST_ONLINE_STORE_TYPE=${use_postgres ? "postgres" : "sqlite"}
+FEAST_ONLINE_STORE_TYPE=${online_store}
+%{ if online_store == "redis" ~}
+FEAST_REDIS_CONNECTION_STRING=feast-redis:6379
+%{ endif ~}
 
 %{ if use_postgres ~}
 # PostgreSQL Configuration
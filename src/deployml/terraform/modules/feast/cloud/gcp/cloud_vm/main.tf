@@ -86,6 +86,7 @@ resource "local_file" "feast_env_config" {
     bigquery_dataset       = var.bigquery_dataset
     artifact_bucket        = var.artifact_bucket
     feast_port            = var.feast_port
+    online_store          = var.online_store != "" ? var.online_store : (var.use_postgres ? "postgres" : "sqlite")
   })
   
   filename = "${path.module}/feast_environment.env"
@@ -7,7 +7,10 @@ output "feast_registry_uri" {
 }
 
 output "feast_online_store_config" {
-  value = var.use_postgres ? {
+  value = var.online_store == "redis" ? {
+    type              = "redis"
+    connection_string = "feast-redis:6379"
+  } : var.use_postgres ? {
     type     = "postgres"
     host     = var.postgres_host
     port     = var.postgres_port
@@ -67,6 +67,16 @@ variable "use_postgres" {
   default     = false
 }
 
+variable "online_store" {
+  type        = string
+  description = "Online store type (postgres, sqlite or redis); empty derives it from use_postgres"
+  default     = ""
+  validation {
+    condition     = contains(["", "postgres", "sqlite", "redis"], var.online_store)
+    error_message = "online_store must be postgres, sqlite or redis."
+  }
+}
+
 variable "feast_port" {
   type        = number
   description = "Port for Feast server"
@@ -1,5 +1,17 @@
 data "google_project" "current" {}
 
+locals {
+  # Scaling and cold-start annotations driven by var.performance
+  performance_annotations = merge({
+    "autoscaling.knative.dev/minScale"      = tostring(var.performance.min_instances)
+    "autoscaling.knative.dev/maxScale"      = tostring(var.performance.max_instances)
+    "run.googleapis.com/cpu-throttling"     = var.performance.cpu_always_allocated ? "false" : "true"
+    "run.googleapis.com/startup-cpu-boost"  = tostring(var.performance.cpu_boost)
+  }, var.performance.gen2 ? {
+    "run.googleapis.com/execution-environment" = "gen2"
+  } : {})
+}
+
 resource "google_cloud_run_service" "grafana" {
   name     = var.service_name
   location = var.region
@@ -7,13 +19,15 @@ resource "google_cloud_run_service" "grafana" {
 
   template {
     metadata {
-      annotations = var.cloudsql_instance_annotation != "" ? {
+      annotations = merge(local.performance_annotations, var.cloudsql_instance_annotation != "" ? {
         "run.googleapis.com/cloudsql-instances" = var.cloudsql_instance_annotation
-      } : {}
+      } : {})
     }
     
     spec {
-      service_account_name = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
+      service_account_name  = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
+      container_concurrency = var.performance.container_concurrency
+      timeout_seconds       = var.performance.timeout_seconds
       containers {
         image = var.image
         resources {
@@ -52,4 +52,17 @@ variable "cloudsql_instance_annotation" {
   type        = string
   description = "Cloud SQL instance connection annotation"
   default     = ""
-}
\ No newline at end of file
+}
+variable "performance" {
+  description = "Scaling and cold-start settings from the stage's performance block; unset fields keep the module defaults"
+  type = object({
+    min_instances         = optional(number, 0)
+    max_instances         = optional(number, 100)
+    container_concurrency = optional(number, 80)
+    cpu_boost             = optional(bool, false)
+    cpu_always_allocated  = optional(bool, false)
+    timeout_seconds       = optional(number, 300)
+    gen2                  = optional(bool, false)
+  })
+  default = {}
+}
@@ -129,4 +129,17 @@ variable "gcp_service_list" {
     "monitoring.googleapis.com",               # For monitoring
     "logging.googleapis.com",                  # For logging
   ]
-}
\ No newline at end of file
+}
+variable "performance" {
+  description = "Scaling and cold-start settings from the stage's performance block; unset fields keep the module defaults"
+  type = object({
+    min_instances         = optional(number, 0)
+    max_instances         = optional(number, 10)
+    container_concurrency = optional(number, 80)
+    cpu_boost             = optional(bool, false)
+    cpu_always_allocated  = optional(bool, true)
+    timeout_seconds       = optional(number, 300)
+    gen2                  = optional(bool, false)
+  })
+  default = {}
+}
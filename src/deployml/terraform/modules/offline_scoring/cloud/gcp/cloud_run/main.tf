@@ -18,16 +18,53 @@ resource "google_cloud_run_v2_job" "offline_scoring" {
   depends_on = [google_project_service.required]
 
   template {
-    task_count  = 1
-    parallelism = 1
+    task_count  = var.task_count
+    parallelism = var.parallelism
     
     template {
-      max_retries     = 3
+      max_retries     = var.max_retries
+      timeout         = var.task_timeout
       service_account = "${data.google_project.current.number}-compute@developer.gserviceaccount.com"
       
       containers {
         image = var.image
         
+        # Shard metadata: each task scores a disjoint slice of the source table.
+        # Cloud Run also sets CLOUD_RUN_TASK_INDEX and CLOUD_RUN_TASK_COUNT per task.
+        env {
+          name  = "SHARD_COUNT"
+          value = tostring(var.task_count)
+        }
+        
+        env {
+          name  = "SHARD_STRATEGY"
+          value = var.shard_strategy
+        }
+        
+        dynamic "env" {
+          for_each = var.shard_partition_column != "" ? [1] : []
+          content {
+            name  = "SHARD_PARTITION_COLUMN"
+            value = var.shard_partition_column
+          }
+        }
+        
+        dynamic "env" {
+          for_each = var.shard_key_min != "" ? [1] : []
+          content {
+            name  = "SHARD_KEY_MIN"
+            value = var.shard_key_min
+          }
+        }
+        
+        dynamic "env" {
+          for_each = var.shard_key_max != "" ? [1] : []
+          content {
+            name  = "SHARD_KEY_MAX"
+            value = var.shard_key_max
+          }
+        }
+        
         # Environment variables for offline scoring
         env {
           name  = "FEAST_OFFLINE_STORE_PROJECT_ID"
@@ -144,8 +181,8 @@ resource "google_cloud_run_v2_job" "offline_scoring" {
         
         resources {
           limits = {
-            cpu    = var.cpu_limit
-            memory = var.memory_limit
+            cpu    = var.task_cpu != "" ? var.task_cpu : var.cpu_limit
+            memory = var.task_memory != "" ? var.task_memory : var.memory_limit
           }
         }
       }
@@ -42,4 +42,14 @@ output "model_configuration" {
     model_stage = var.model_stage
     tracking_uri = var.mlflow_tracking_uri
   }
-}
\ No newline at end of file
+}
+
+output "sharding" {
+  description = "Parallel execution settings of the scoring job"
+  value = {
+    task_count       = var.task_count
+    parallelism      = var.parallelism
+    strategy         = var.shard_strategy
+    partition_column = var.shard_partition_column
+  }
+}
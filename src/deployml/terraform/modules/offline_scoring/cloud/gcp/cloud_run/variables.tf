@@ -63,6 +63,72 @@ variable "memory_request" {
   default     = "2Gi"
 }
 
+# Parallel execution: the table is split into task_count shards
+variable "task_count" {
+  description = "Number of tasks (shards) per job execution"
+  type        = number
+  default     = 1
+}
+
+variable "parallelism" {
+  description = "Maximum number of tasks running at once (0 = as many as task_count allows)"
+  type        = number
+  default     = 1
+}
+
+variable "task_cpu" {
+  description = "CPU limit per task (overrides cpu_limit when set, e.g. 4)"
+  type        = string
+  default     = ""
+}
+
+variable "task_memory" {
+  description = "Memory limit per task (overrides memory_limit when set, e.g. 8Gi)"
+  type        = string
+  default     = ""
+}
+
+variable "task_timeout" {
+  description = "Maximum run time of a single task, as a duration such as 3600s"
+  type        = string
+  default     = "3600s"
+}
+
+variable "max_retries" {
+  description = "Retries per failed task"
+  type        = number
+  default     = 3
+}
+
+variable "shard_strategy" {
+  description = "How tasks split the source rows: hash (hash of the partition column modulo task count) or range (even split of [shard_key_min, shard_key_max))"
+  type        = string
+  default     = "hash"
+
+  validation {
+    condition     = contains(["hash", "range"], var.shard_strategy)
+    error_message = "shard_strategy must be hash or range."
+  }
+}
+
+variable "shard_partition_column" {
+  description = "Column used to assign rows to shards (required when task_count > 1)"
+  type        = string
+  default     = ""
+}
+
+variable "shard_key_min" {
+  description = "Inclusive lower bound of the partition column for range sharding"
+  type        = string
+  default     = ""
+}
+
+variable "shard_key_max" {
+  description = "Exclusive upper bound of the partition column for range sharding"
+  type        = string
+  default     = ""
+}
+
 # Database Configuration
 variable "database_url" {
   description = "PostgreSQL connection string for storing predictions (can be passed from cloud_sql_postgres module)"
@@ -9,6 +9,18 @@ resource "google_project_service" "required" {
 
 data "google_project" "current" {}
 
+locals {
+  # Scaling and cold-start annotations driven by var.performance
+  performance_annotations = merge({
+    "autoscaling.knative.dev/minScale"      = tostring(var.performance.min_instances)
+    "autoscaling.knative.dev/maxScale"      = tostring(var.performance.max_instances)
+    "run.googleapis.com/cpu-throttling"     = var.performance.cpu_always_allocated ? "false" : "true"
+    "run.googleapis.com/startup-cpu-boost"  = tostring(var.performance.cpu_boost)
+  }, var.performance.gen2 ? {
+    "run.googleapis.com/execution-environment" = "gen2"
+  } : {})
+}
+
 # Cloud Run service - only create if explicitly requested
 resource "google_cloud_run_service" "wandb" {
   count    = var.create_service && var.image != "" && var.service_name != "" ? 1 : 0
@@ -19,14 +31,11 @@ resource "google_cloud_run_service" "wandb" {
 
   template {
     metadata {
-      annotations = {
-        "autoscaling.knative.dev/maxScale" = "10"
-        "run.googleapis.com/cpu-throttling" = "false"
-      }
+      annotations = local.performance_annotations
     }
     spec {
-      container_concurrency = 80
-      timeout_seconds       = 300
+      container_concurrency = var.performance.container_concurrency
+      timeout_seconds       = var.performance.timeout_seconds
       containers {
         image = var.image
         ports {
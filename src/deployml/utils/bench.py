@@ -0,0 +1,139 @@
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from deployml.utils.loadtest import RequestSpec
+
+BENCH_EXPERIMENT_NAME = "deployml-bench"
+SCENARIOS = ["predict", "feast", "mlflow"]
+
+
+def load_payload(path: Optional[Path]) -> Optional[object]:
+    """Read a JSON request body from a file, if given."""
+    return json.loads(path.read_text()) if path else None
+
+
+def predict_specs(
+    url: str, payload: Optional[object] = None, batch_size: int = 1
+) -> List[RequestSpec]:
+    """
+    Requests for the serving app's /predict endpoint.
+
+    Without a payload, a batch of all-zero rows is built from the feature
+    names the app reports on /model-info.
+
+    Raises:
+        ValueError: If no payload is given and the model's features are unknown.
+    """
+    if payload is None:
+        try:
+            info = httpx.get(f"{url}/model-info", timeout=30).json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise ValueError(f"could not read /model-info: {e}")
+        features = info.get("feature_names")
+        if not features:
+            raise ValueError(
+                "no model loaded or model has no signature; pass --predict-payload"
+            )
+        payload = {
+            "columns": features,
+            "data": [[0.0] * len(features) for _ in range(batch_size)],
+        }
+    return [RequestSpec("POST", "/predict", json=payload)]
+
+
+def feast_specs(payload: Optional[object]) -> List[RequestSpec]:
+    """
+    Requests for the Feast /get-online-features endpoint.
+
+    The body names the features and entity keys, e.g.
+    {"features": ["driver_stats:rate"], "entities": {"driver_id": [1001, 1002]}}.
+
+    Raises:
+        ValueError: If no payload is given.
+    """
+    if payload is None:
+        raise ValueError("pass --feast-payload with features and entity keys")
+    return [RequestSpec("POST", "/get-online-features", json=payload)]
+
+
+def mlflow_specs(url: str) -> List[RequestSpec]:
+    """
+    Alternating log_metric and search_runs calls against the MLflow REST API.
+
+    A run is created in the `deployml-bench` experiment to receive the metrics.
+
+    Raises:
+        ValueError: If the experiment or run cannot be created.
+    """
+    api = f"{url}/api/2.0/mlflow"
+    try:
+        with httpx.Client(timeout=30) as client:
+            response = client.get(
+                f"{api}/experiments/get-by-name",
+                params={"experiment_name": BENCH_EXPERIMENT_NAME},
+            )
+            if response.status_code == 200:
+                experiment_id = response.json()["experiment"]["experiment_id"]
+            else:
+                response = client.post(
+                    f"{api}/experiments/create", json={"name": BENCH_EXPERIMENT_NAME}
+                )
+                response.raise_for_status()
+                experiment_id = response.json()["experiment_id"]
+            response = client.post(
+                f"{api}/runs/create",
+                json={
+                    "experiment_id": experiment_id,
+                    "start_time": int(time.time() * 1000),
+                    "run_name": "bench",
+                },
+            )
+            response.raise_for_status()
+            run_id = response.json()["run"]["info"]["run_id"]
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        raise ValueError(f"could not create an MLflow run: {e}")
+
+    return [
+        RequestSpec(
+            "POST",
+            "/api/2.0/mlflow/runs/log-metric",
+            json={
+                "run_id": run_id,
+                "key": "bench_metric",
+                "value": 1.0,
+                "timestamp": int(time.time() * 1000),
+                "step": 0,
+            },
+        ),
+        RequestSpec(
+            "POST",
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": [experiment_id], "max_results": 10},
+        ),
+    ]
+
+
+def scenario_urls(outputs: Dict) -> Dict[str, Optional[str]]:
+    """
+    Target URL per scenario from Terraform outputs (Cloud Run or VM names).
+
+    On VMs Feast requests go through the feast-fastapi proxy, which serves
+    /get-online-features; on Cloud Run the Feast service itself does.
+    """
+
+    def first(*keys: str) -> Optional[str]:
+        for key in keys:
+            value = (outputs.get(key) or {}).get("value")
+            if isinstance(value, str) and value.startswith(("http://", "https://")):
+                return value.rstrip("/")
+        return None
+
+    return {
+        "predict": first("model_serving_fastapi_url", "fastapi_url"),
+        "feast": first("feast_fastapi_url", "feature_store_feast_url"),
+        "mlflow": first("experiment_tracking_mlflow_url", "mlflow_url"),
+    }
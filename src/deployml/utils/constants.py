@@ -48,4 +48,33 @@ REQUIRED_GCP_APIS = [
     "monitoring.googleapis.com",
     "logging.googleapis.com",
     "artifactregistry.googleapis.com",
-]
\ No newline at end of file
+]
+# Cloud Run scaling / cold-start knobs accepted in a tool's `params.performance` block
+PERFORMANCE_KEYS = [
+    "min_instances",
+    "max_instances",
+    "container_concurrency",
+    "cpu_boost",
+    "cpu_always_allocated",
+    "timeout_seconds",
+    "gen2",
+]
+
+# Named presets for `performance: <name>` (or `performance: {preset: <name>, ...overrides}`)
+PERFORMANCE_PRESETS = {
+    "latency": {
+        "min_instances": 1,
+        "max_instances": 10,
+        "container_concurrency": 80,
+        "cpu_boost": True,
+        "cpu_always_allocated": True,
+        "gen2": True,
+    },
+    "cost": {
+        "min_instances": 0,
+        "max_instances": 3,
+        "container_concurrency": 80,
+        "cpu_boost": False,
+        "cpu_always_allocated": False,
+    },
+}
@@ -0,0 +1,338 @@
+import importlib.util
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+SUPPORTED_SUFFIXES = (".csv", ".parquet", ".pq")
+
+
+@dataclass
+class StepResult:
+    """Size and timing of one step of a data push"""
+
+    name: str
+    seconds: float
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    files: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        if self.rows is None or not self.seconds:
+            return None
+        return self.rows / self.seconds
+
+    @property
+    def mb_per_second(self) -> Optional[float]:
+        if self.bytes is None or not self.seconds:
+            return None
+        return self.bytes / self.seconds / 1024 / 1024
+
+
+def _require_pyarrow():
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("deployml data push needs pyarrow: pip install 'deployml-core[feast]'")
+
+
+def open_source(path: Path, batch_size: int = 65536):
+    """
+    Open a CSV or Parquet file as a streaming Arrow record batch reader.
+
+    Args:
+        path (Path): Local .csv or .parquet file.
+        batch_size (int): Rows per batch for Parquet input.
+
+    Returns:
+        pyarrow.RecordBatchReader: Reader that never holds the whole file in memory.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pa_csv.open_csv(path, read_options=pa_csv.ReadOptions(block_size=64 << 20))
+    if suffix in (".parquet", ".pq"):
+        parquet_file = pq.ParquetFile(path)
+        return pa.RecordBatchReader.from_batches(
+            parquet_file.schema_arrow, parquet_file.iter_batches(batch_size=batch_size)
+        )
+    raise ValueError(f"Unsupported file type {suffix}; expected one of {', '.join(SUPPORTED_SUFFIXES)}")
+
+
+def write_shards(
+    source: Path,
+    out_dir: Path,
+    rows_per_shard: int = 1_000_000,
+    compression: str = "zstd",
+) -> Tuple[List[Path], StepResult]:
+    """
+    Stream a local file into compressed Parquet shards.
+
+    Args:
+        source (Path): CSV or Parquet input.
+        out_dir (Path): Directory for `part-*.parquet` shards.
+        rows_per_shard (int): Maximum rows per shard.
+        compression (str): Parquet codec (zstd, snappy or gzip load in BigQuery).
+
+    Returns:
+        Tuple[List[Path], StepResult]: Shard paths and the step's size and timing.
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    started = time.perf_counter()
+    reader = open_source(source)
+    file_format = ds.ParquetFileFormat()
+    ds.write_dataset(
+        reader,
+        out_dir,
+        format=file_format,
+        file_options=file_format.make_write_options(compression=compression),
+        basename_template="part-{i}.parquet",
+        max_rows_per_file=rows_per_shard,
+        max_rows_per_group=min(rows_per_shard, 128 * 1024),
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    shards = sorted(out_dir.glob("part-*.parquet"))
+    rows = sum(pq.ParquetFile(path).metadata.num_rows for path in shards)
+    result = StepResult(
+        name="Shard",
+        seconds=time.perf_counter() - started,
+        rows=rows,
+        bytes=sum(path.stat().st_size for path in shards),
+        files=len(shards),
+    )
+    return shards, result
+
+
+def upload_shards(
+    shards: List[Path],
+    bucket_name: str,
+    prefix: str,
+    project_id: Optional[str] = None,
+    max_workers: int = 8,
+) -> StepResult:
+    """
+    Upload shards to GCS in parallel with the storage transfer manager.
+
+    Args:
+        shards (List[Path]): Local shard files (all in one directory).
+        bucket_name (str): Destination bucket.
+        prefix (str): Object prefix the shards are written under.
+        project_id (Optional[str]): Project for the storage client.
+        max_workers (int): Concurrent uploads.
+
+    Returns:
+        StepResult: Bytes, files and timing of the upload.
+    """
+    from google.cloud import storage
+    from google.cloud.storage import transfer_manager
+
+    started = time.perf_counter()
+    bucket = storage.Client(project=project_id).bucket(bucket_name)
+    results = transfer_manager.upload_many_from_filenames(
+        bucket,
+        [path.name for path in shards],
+        source_directory=str(shards[0].parent),
+        blob_name_prefix=f"{prefix.rstrip('/')}/",
+        max_workers=max_workers,
+        worker_type=transfer_manager.THREAD,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise RuntimeError(f"{len(errors)} of {len(shards)} shard upload(s) failed: {errors[0]}")
+    return StepResult(
+        name="Upload",
+        seconds=time.perf_counter() - started,
+        bytes=sum(path.stat().st_size for path in shards),
+        files=len(shards),
+    )
+
+
+def load_to_bigquery(
+    source_uri: str,
+    table_id: str,
+    project_id: Optional[str] = None,
+    write_disposition: str = "WRITE_APPEND",
+    time_partition_field: Optional[str] = None,
+) -> StepResult:
+    """
+    Load Parquet shards into a BigQuery table with a single load job.
+
+    Args:
+        source_uri (str): gs:// wildcard URI of the shards.
+        table_id (str): Destination `project.dataset.table`.
+        project_id (Optional[str]): Project that runs the job.
+        write_disposition (str): WRITE_APPEND or WRITE_TRUNCATE.
+        time_partition_field (Optional[str]): Column for daily time partitioning.
+
+    Returns:
+        StepResult: Rows, bytes and timing reported by the load job.
+    """
+    try:
+        from google.cloud import bigquery
+    except ImportError:
+        raise ImportError("deployml data push needs google-cloud-bigquery: pip install 'deployml-core[feast]'")
+
+    started = time.perf_counter()
+    client = bigquery.Client(project=project_id)
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=write_disposition,
+    )
+    if time_partition_field:
+        job_config.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY, field=time_partition_field
+        )
+    job = client.load_table_from_uri(source_uri, table_id, job_config=job_config)
+    job.result()
+    return StepResult(
+        name="BigQuery load",
+        seconds=time.perf_counter() - started,
+        rows=job.output_rows,
+        bytes=job.output_bytes,
+        files=job.input_files,
+    )
+
+
+def table_name_for(source: Path) -> str:
+    """BigQuery-safe table name derived from a file name."""
+    name = re.sub(r"[^0-9a-zA-Z_]", "_", source.stem).strip("_").lower()
+    return name or "data"
+
+
+def find_artifact_bucket(outputs: Dict) -> Optional[str]:
+    """First artifact bucket name found in Terraform outputs."""
+    for key, value in outputs.items():
+        output_val = value.get("value") if isinstance(value, dict) else None
+        if (key.startswith("bucket_name") or key.endswith("_bucket")) and isinstance(output_val, str) and output_val:
+            return output_val
+    return None
+
+
+def resolve_table_id(
+    config: Dict,
+    outputs: Dict,
+    source: Path,
+    dataset: Optional[str] = None,
+    table: Optional[str] = None,
+) -> str:
+    """
+    Destination table for a push.
+
+    The dataset comes from `--dataset`, the deployed Feast offline dataset,
+    or the feature_store stage's `bigquery_dataset` param, in that order. A
+    param already naming a table (`project.dataset.table`) is used as is
+    unless a table is given.
+
+    Raises:
+        ValueError: If no dataset can be determined.
+    """
+    project_id = config.get("provider", {}).get("project_id", "")
+    if not dataset:
+        feast_info = outputs.get("feast_deployment_info", {}).get("value") or {}
+        dataset = feast_info.get("offline_dataset")
+    if not dataset:
+        for stage in config.get("stack", []):
+            for stage_name, tool in stage.items():
+                if stage_name == "feature_store":
+                    dataset = (tool.get("params") or {}).get("bigquery_dataset")
+    if not dataset:
+        raise ValueError("no BigQuery dataset configured; pass --dataset")
+
+    parts = dataset.split(".")
+    if len(parts) == 3 and not table:
+        return dataset
+    if len(parts) >= 2:
+        project_id, dataset = parts[0], parts[1]
+    return f"{project_id}.{dataset}.{table or table_name_for(source)}"
+
+
+def push_dataset(
+    source: Path,
+    bucket_name: str,
+    table_id: str,
+    project_id: Optional[str] = None,
+    rows_per_shard: int = 1_000_000,
+    compression: str = "zstd",
+    max_workers: int = 8,
+    write_disposition: str = "WRITE_APPEND",
+    time_partition_field: Optional[str] = None,
+    local_dir: Optional[Path] = None,
+) -> Tuple[str, List[StepResult]]:
+    """
+    Shard a local file, upload the shards and load them into BigQuery.
+
+    Shards go to a temporary directory that is removed afterwards, unless
+    `local_dir` is given, in which case they are kept there.
+
+    Returns:
+        Tuple[str, List[StepResult]]: GCS prefix of the shards and per-step results.
+    """
+    work_dir = Path(local_dir) if local_dir else Path(tempfile.mkdtemp(prefix="deployml-push-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    if any(work_dir.glob("part-*.parquet")):
+        raise ValueError(f"{work_dir} already contains shards; use an empty directory")
+    try:
+        shards, shard_step = write_shards(source, work_dir, rows_per_shard, compression)
+        if not shards:
+            raise ValueError(f"{source} contains no rows")
+        prefix = f"datasets/{table_name_for(source)}/{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        upload_step = upload_shards(shards, bucket_name, prefix, project_id, max_workers)
+        upload_step.rows = shard_step.rows
+        load_step = load_to_bigquery(
+            f"gs://{bucket_name}/{prefix}/part-*.parquet",
+            table_id,
+            project_id,
+            write_disposition,
+            time_partition_field,
+        )
+    finally:
+        if not local_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return f"gs://{bucket_name}/{prefix}", [shard_step, upload_step, load_step]
+
+
+def print_push_report(steps: List[StepResult], title: str) -> None:
+    """
+    Print per-step throughput of a data push.
+
+    Args:
+        steps (List[StepResult]): Results in execution order.
+        title (str): Table title.
+    """
+    table = Table(title=title)
+    table.add_column("Step", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Size (MB)", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows/s", justify="right")
+    table.add_column("MB/s", justify="right")
+
+    def fmt(value, pattern="{:,.0f}"):
+        return "-" if value is None else pattern.format(value)
+
+    for step in steps:
+        table.add_row(
+            step.name,
+            fmt(step.files),
+            fmt(step.rows),
+            fmt(step.bytes / 1024 / 1024 if step.bytes is not None else None, "{:,.1f}"),
+            f"{step.seconds:.1f}",
+            fmt(step.rows_per_second),
+            fmt(step.mb_per_second, "{:,.1f}"),
+        )
+    total_seconds = sum(step.seconds for step in steps)
+    table.add_row("Total", "", "", "", f"{total_seconds:.1f}", "", "", style="bold")
+    Console().print(table)
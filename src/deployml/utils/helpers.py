@@ -5,7 +5,13 @@ from typing import Optional
 from google.cloud import storage
 import random
 import string
-from deployml.utils.constants import ANIMAL_NAMES, FALLBACK_WORDS, TERRAFORM_DIR
+from deployml.utils.constants import (
+    ANIMAL_NAMES,
+    FALLBACK_WORDS,
+    PERFORMANCE_KEYS,
+    PERFORMANCE_PRESETS,
+    TERRAFORM_DIR,
+)
 import subprocess
 import time
 from rich.progress import (
@@ -191,6 +197,113 @@ def generate_bucket_name(project_id: str) -> str:
     return f"{word}-bucket-{project_id}-{suffix}".replace("_", "-")
 
 
+def resolve_performance(performance) -> dict:
+    """
+    Expand a stage's `performance` block into explicit Cloud Run settings.
+
+    The block is either a preset name (e.g. "latency") or a mapping with an
+    optional `preset` key whose values are overridden by the other keys.
+    Settings that are left out keep the module defaults.
+
+    Args:
+        performance: Preset name, mapping, or None.
+
+    Returns:
+        dict: Settings keyed by PERFORMANCE_KEYS.
+
+    Raises:
+        ValueError: If the preset or a key is unknown.
+    """
+    if not performance:
+        return {}
+    if isinstance(performance, str):
+        performance = {"preset": performance}
+    if not isinstance(performance, dict):
+        raise ValueError("performance must be a preset name or a mapping")
+
+    overrides = dict(performance)
+    preset = overrides.pop("preset", None)
+    resolved = {}
+    if preset is not None:
+        if preset not in PERFORMANCE_PRESETS:
+            raise ValueError(
+                f"Unknown performance preset '{preset}' (choose from: {', '.join(PERFORMANCE_PRESETS)})"
+            )
+        resolved.update(PERFORMANCE_PRESETS[preset])
+
+    unknown = set(overrides) - set(PERFORMANCE_KEYS)
+    if unknown:
+        raise ValueError(
+            f"Unknown performance setting(s): {', '.join(sorted(unknown))}"
+        )
+    resolved.update(overrides)
+    return resolved
+
+
+def update_performance(config_path: Path, stage: str, settings: dict) -> None:
+    """
+    Merge settings into a stage's `performance` block, editing the YAML in place.
+
+    The file is round-tripped with ruamel.yaml, so comments, key order and
+    quoting elsewhere in the config are left as they were. A preset-name
+    block becomes a mapping that keeps the preset.
+
+    Args:
+        config_path (Path): Stack YAML config.
+        stage (str): Stage whose tool is updated (e.g. model_serving).
+        settings (dict): Performance keys to set.
+
+    Raises:
+        ValueError: If the stage is not in the stack.
+    """
+    from ruamel.yaml import YAML
+    from ruamel.yaml.comments import CommentedMap
+    from ruamel.yaml.util import load_yaml_guess_indent
+
+    text = config_path.read_text()
+    _, indent, block_seq_indent = load_yaml_guess_indent(text)
+    yaml_rt = YAML()
+    yaml_rt.preserve_quotes = True
+    yaml_rt.indent(mapping=block_seq_indent or 2, sequence=indent, offset=block_seq_indent)
+    config = yaml_rt.load(text)
+    tool = next(
+        (entry[stage] for entry in config.get("stack") or [] if stage in entry),
+        None,
+    )
+    if tool is None:
+        raise ValueError(f"Stage '{stage}' not found in {config_path}")
+    if tool.get("params") is None:
+        tool["params"] = CommentedMap()
+    params = tool["params"]
+
+    performance = params.get("performance")
+    if isinstance(performance, str):
+        performance = CommentedMap([("preset", performance)])
+    elif performance is None:
+        performance = CommentedMap()
+    performance.update(settings)
+    params["performance"] = performance
+
+    with open(config_path, "w") as f:
+        yaml_rt.dump(config, f)
+
+
+def workspace_terraform_dir(config: dict) -> Path:
+    """
+    Terraform working directory of a stack's workspace.
+
+    Workspaces live under ./.deployml, named after the config's `name`
+    (or "development" when it has none).
+
+    Args:
+        config (dict): Parsed stack YAML config.
+
+    Returns:
+        Path: .deployml/<name>/terraform under the current directory.
+    """
+    return Path.cwd() / ".deployml" / (config.get("name") or "development") / "terraform"
+
+
 def estimate_terraform_time(plan_output: str, operation: str = "apply") -> str:
     """
     Estimate time for Terraform operations based on resource count and types.
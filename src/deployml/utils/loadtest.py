@@ -0,0 +1,345 @@
+import asyncio
+import itertools
+import math
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+
+@dataclass
+class RequestSpec:
+    """A single request template issued by the load generator"""
+
+    method: str
+    path: str
+    json: Optional[object] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
+@dataclass
+class LoadResult:
+    """Latency and throughput measured for one load level"""
+
+    name: str
+    concurrency: int
+    duration_seconds: float
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return len(self.latencies) / self.duration_seconds
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency percentile in milliseconds (nearest-rank)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+        return ordered[rank] * 1000
+
+    def summary(self) -> Dict:
+        """JSON-serialisable summary of this result."""
+        return {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 4),
+            "throughput_rps": round(self.throughput, 2),
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "p99_ms": _round(self.percentile(99)),
+            "duration_seconds": round(self.duration_seconds, 2),
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+        }
+
+
+async def run_load(
+    base_url: str,
+    specs: List[RequestSpec],
+    concurrency: int,
+    duration: float,
+    rate: Optional[float] = None,
+    timeout: float = 30.0,
+    name: str = "load",
+) -> LoadResult:
+    """
+    Drive a service with requests for a fixed duration.
+
+    Without `rate` this is a closed loop: `concurrency` workers each send the
+    next request as soon as the previous one finished. With `rate`, requests
+    are started on a fixed schedule (open loop) and `concurrency` caps the
+    number in flight; requests that cannot start on time are counted as errors.
+
+    Args:
+        base_url (str): Service base URL.
+        specs (List[RequestSpec]): Requests to issue, in round-robin order.
+        concurrency (int): Workers (closed loop) or in-flight cap (open loop).
+        duration (float): Seconds to run.
+        rate (Optional[float]): Target requests per second (open loop).
+        timeout (float): Per-request timeout in seconds.
+        name (str): Label for the result.
+
+    Returns:
+        LoadResult: Measured latencies and error counts.
+    """
+    result = LoadResult(name=name, concurrency=concurrency, duration_seconds=0.0)
+    cycle = itertools.cycle(specs)
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+
+    async with httpx.AsyncClient(
+        base_url=base_url.rstrip("/"), limits=limits, timeout=timeout
+    ) as client:
+
+        async def issue(spec: RequestSpec):
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    spec.method, spec.path, json=spec.json, headers=spec.headers
+                )
+                elapsed = time.perf_counter() - started
+                result.status_codes[response.status_code] = (
+                    result.status_codes.get(response.status_code, 0) + 1
+                )
+                if response.status_code < 400:
+                    result.latencies.append(elapsed)
+                else:
+                    result.errors += 1
+            except httpx.HTTPError:
+                result.errors += 1
+
+        started = time.perf_counter()
+        deadline = started + duration
+
+        if rate is None:
+
+            async def worker():
+                while time.perf_counter() < deadline:
+                    await issue(next(cycle))
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+            tasks = []
+
+            async def limited(spec: RequestSpec):
+                try:
+                    await issue(spec)
+                finally:
+                    semaphore.release()
+
+            interval = 1.0 / rate
+            next_start = started
+            while next_start < deadline:
+                await asyncio.sleep(max(0.0, next_start - time.perf_counter()))
+                if semaphore.locked():
+                    result.errors += 1
+                else:
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(limited(next(cycle))))
+                next_start += interval
+            await asyncio.gather(*tasks)
+
+        result.duration_seconds = time.perf_counter() - started
+    return result
+
+
+def sweep_concurrency(
+    base_url: str,
+    specs: List[RequestSpec],
+    levels: List[int],
+    duration: float,
+    timeout: float = 30.0,
+    on_result=None,
+) -> List[LoadResult]:
+    """
+    Run a closed-loop load test at each concurrency level in turn.
+
+    Args:
+        base_url (str): Service base URL.
+        specs (List[RequestSpec]): Requests to issue.
+        levels (List[int]): Concurrency levels, ascending.
+        duration (float): Seconds per level.
+        timeout (float): Per-request timeout in seconds.
+        on_result: Optional callback invoked with each LoadResult.
+
+    Returns:
+        List[LoadResult]: One result per level.
+    """
+    results = []
+    for level in levels:
+        result = asyncio.run(
+            run_load(
+                base_url,
+                specs,
+                concurrency=level,
+                duration=duration,
+                timeout=timeout,
+                name=f"c={level}",
+            )
+        )
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def find_knee(
+    results: List[LoadResult],
+    p99_slo_ms: Optional[float] = None,
+    max_error_rate: float = 0.01,
+    throughput_fraction: float = 0.9,
+) -> Optional[LoadResult]:
+    """
+    Pick the lowest concurrency that reaches most of the peak throughput.
+
+    Levels with too many errors, or a p99 above the SLO, are discarded. Past
+    the knee, extra concurrency only queues requests inside the instance:
+    latency rises while throughput stays flat.
+
+    Args:
+        results (List[LoadResult]): Sweep results.
+        p99_slo_ms (Optional[float]): p99 latency budget in milliseconds.
+        max_error_rate (float): Highest acceptable error rate.
+        throughput_fraction (float): Share of peak throughput that counts as saturated.
+
+    Returns:
+        Optional[LoadResult]: The knee level, or None if no level qualified.
+    """
+    candidates = [
+        r
+        for r in results
+        if r.latencies
+        and r.error_rate <= max_error_rate
+        and (p99_slo_ms is None or r.percentile(99) <= p99_slo_ms)
+    ]
+    if not candidates:
+        return None
+    peak = max(r.throughput for r in candidates)
+    for result in sorted(candidates, key=lambda r: r.concurrency):
+        if result.throughput >= throughput_fraction * peak:
+            return result
+    return None
+
+
+def docker_resource_args(cpu_limit: Optional[str], memory_limit: Optional[str]) -> List[str]:
+    """Translate Cloud Run limits ("2000m", "2Gi") into `docker run` flags."""
+    args = []
+    if cpu_limit:
+        cpu = str(cpu_limit)
+        cpus = float(cpu[:-1]) / 1000 if cpu.endswith("m") else float(cpu)
+        args += ["--cpus", f"{cpus:g}"]
+    if memory_limit:
+        memory = str(memory_limit)
+        for suffix, unit in (("Gi", "g"), ("Mi", "m"), ("G", "g"), ("M", "m")):
+            if memory.endswith(suffix):
+                memory = memory[: -len(suffix)] + unit
+                break
+        args += ["--memory", memory]
+    return args
+
+
+def start_local_container(
+    image: str,
+    host_port: int,
+    resource_args: List[str],
+    env: Optional[Dict[str, str]] = None,
+    ready_path: str = "/health",
+    timeout: float = 120.0,
+) -> str:
+    """
+    Start a local stand-in of a Cloud Run service and wait until it answers.
+
+    The container gets the same CPU and memory limits as the Cloud Run
+    revision and listens on PORT=8080, like Cloud Run.
+
+    Returns:
+        str: Container id (remove it with stop_local_container).
+
+    Raises:
+        RuntimeError: If the container fails to start or never becomes ready.
+    """
+    cmd = ["docker", "run", "-d", "--rm", "-p", f"127.0.0.1:{host_port}:8080", "-e", "PORT=8080"]
+    for key, value in (env or {}).items():
+        cmd += ["-e", f"{key}={value}"]
+    cmd += resource_args + [image]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or "docker run failed")
+    container_id = proc.stdout.strip()
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{host_port}{ready_path}", timeout=5).status_code < 500:
+                return container_id
+        except httpx.HTTPError:
+            pass
+        time.sleep(1)
+    stop_local_container(container_id)
+    raise RuntimeError(f"container did not answer on {ready_path} within {timeout:.0f}s")
+
+
+def stop_local_container(container_id: str) -> None:
+    subprocess.run(
+        ["docker", "rm", "-f", container_id],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value:.1f}" if value is not None else "-"
+
+
+def print_load_table(
+    results: List[LoadResult], title: str, highlight: Optional[LoadResult] = None
+) -> None:
+    """Render load test results as a table, optionally highlighting one row."""
+    table = Table(title=title)
+    table.add_column("Scenario")
+    table.add_column("Concurrency", justify="right")
+    table.add_column("Requests", justify="right")
+    table.add_column("RPS", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Errors", justify="right")
+
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.concurrency),
+            str(result.requests),
+            f"{result.throughput:.1f}",
+            _ms(result.percentile(50)),
+            _ms(result.percentile(95)),
+            _ms(result.percentile(99)),
+            f"{result.error_rate:.1%}",
+            style="bold green" if result is highlight else None,
+        )
+    Console().print(table)
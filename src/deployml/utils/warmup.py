@@ -0,0 +1,263 @@
+import json
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from rich.console import Console
+from rich.table import Table
+
+# Outputs that are not HTTP services or duplicate another service's endpoint
+SKIPPED_OUTPUT_MARKERS = ("grpc", "health", "docs", "container_info", "logs")
+
+# HTTP statuses that mean the instance is up (auth failures still prove it started)
+UP_STATUSES = set(range(200, 500)) - {408, 429}
+
+# /model-info states in which the serving app has finished starting up
+MODEL_SETTLED_STATES = ("ready", "loaded", "no_model_specified", "error")
+
+
+@dataclass
+class WarmupResult:
+    """Cold-start measurement for a single deployed service"""
+
+    name: str
+    url: str
+    up: bool
+    cold_start_seconds: Optional[float] = None
+    status_code: Optional[int] = None
+    model_status: Optional[str] = None
+    model_load_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+def read_terraform_outputs(terraform_dir: Path) -> Dict:
+    """
+    Read `terraform output -json` from a workspace.
+
+    Args:
+        terraform_dir (Path): Terraform working directory of the workspace.
+
+    Returns:
+        Dict: Output name to Terraform output object, empty if unavailable.
+    """
+    if not terraform_dir.is_dir():
+        return {}
+    try:
+        result = subprocess.run(
+            ["terraform", "output", "-json"],
+            cwd=terraform_dir,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return {}
+    if result.returncode != 0:
+        return {}
+    try:
+        return json.loads(result.stdout) or {}
+    except json.JSONDecodeError:
+        return {}
+
+
+def collect_service_urls(outputs: Dict) -> Dict[str, str]:
+    """
+    Pick one HTTP URL per deployed service from Terraform outputs.
+
+    Outputs ending in `_url` are considered; gRPC, health and docs endpoints
+    are skipped and URLs pointing at the same host and port are deduplicated.
+
+    Args:
+        outputs (Dict): Parsed `terraform output -json`.
+
+    Returns:
+        Dict[str, str]: Service name to base URL.
+    """
+    services = {}
+    seen = set()
+    for key in sorted(outputs):
+        value = outputs[key]
+        if not isinstance(value, dict) or value.get("sensitive"):
+            continue
+        url = value.get("value")
+        if not key.endswith("_url"):
+            continue
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            continue
+        if any(marker in key for marker in SKIPPED_OUTPUT_MARKERS):
+            continue
+        parsed = urlparse(url)
+        if parsed.netloc in seen:
+            continue
+        seen.add(parsed.netloc)
+        services[key[: -len("_url")]] = url.rstrip("/")
+    return services
+
+
+def service_url(outputs: Dict, stage_name: str, tool_name: str) -> Optional[str]:
+    """
+    URL of one stack service from Terraform outputs.
+
+    Cloud Run stacks export `<stage>_<tool>_url`; VM stacks export `<tool>_url`.
+    """
+    for key in (f"{stage_name}_{tool_name}_url", f"{tool_name}_url"):
+        value = outputs.get(key)
+        url = value.get("value") if isinstance(value, dict) else None
+        if isinstance(url, str) and url.startswith(("http://", "https://")):
+            return url.rstrip("/")
+    return None
+
+
+def is_serving_app(name: str) -> bool:
+    return "fastapi" in name and "feast" not in name
+
+
+def wait_until_up(url: str, timeout: float, interval: float) -> tuple:
+    """Poll a URL until it answers; returns (elapsed seconds, status code, error)."""
+    started = time.perf_counter()
+    error = None
+    while True:
+        try:
+            response = requests.get(url, timeout=min(30.0, timeout), allow_redirects=False)
+            if response.status_code in UP_STATUSES:
+                return time.perf_counter() - started, response.status_code, None
+            error = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            error = type(e).__name__
+        if time.perf_counter() - started + interval > timeout:
+            return None, None, error
+        time.sleep(interval)
+
+
+def wait_for_model(
+    url: str, model_name: Optional[str], timeout: float, interval: float
+) -> tuple:
+    """
+    Preload a model on the serving app and wait for it to settle.
+
+    With a model name, `/refresh-model` is called so the first user request does
+    not pay for the download; otherwise `/model-info` is polled until the app
+    has finished starting up.
+
+    Returns:
+        tuple: (model status, elapsed seconds)
+    """
+    started = time.perf_counter()
+    if model_name:
+        try:
+            response = requests.post(
+                f"{url}/refresh-model",
+                json={"model_name": model_name},
+                timeout=timeout,
+            )
+            status = "loaded" if response.ok else f"HTTP {response.status_code}"
+            return status, time.perf_counter() - started
+        except requests.RequestException as e:
+            return type(e).__name__, None
+
+    status = None
+    while time.perf_counter() - started < timeout:
+        try:
+            response = requests.get(f"{url}/model-info", timeout=10)
+            if response.status_code == 404:
+                return "n/a", None
+            if response.ok:
+                status = response.json().get("model_info", {}).get("status")
+                if status in MODEL_SETTLED_STATES:
+                    return status, time.perf_counter() - started
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(interval)
+    return status or "timeout", None
+
+
+def warm_service(
+    name: str,
+    url: str,
+    timeout: float,
+    interval: float,
+    model_name: Optional[str] = None,
+) -> WarmupResult:
+    """Measure the cold start of one service and, for the serving app, its model load."""
+    elapsed, status_code, error = wait_until_up(url, timeout, interval)
+    result = WarmupResult(
+        name=name,
+        url=url,
+        up=elapsed is not None,
+        cold_start_seconds=elapsed,
+        status_code=status_code,
+        error=error if elapsed is None else None,
+    )
+    if result.up and is_serving_app(name):
+        result.model_status, result.model_load_seconds = wait_for_model(
+            url, model_name, timeout, interval
+        )
+    return result
+
+
+def warm_services(
+    services: Dict[str, str],
+    timeout: float = 300.0,
+    interval: float = 2.0,
+    model_name: Optional[str] = None,
+) -> List[WarmupResult]:
+    """
+    Hit every service concurrently until it is up.
+
+    Args:
+        services (Dict[str, str]): Service name to base URL.
+        timeout (float): Per-service time budget in seconds.
+        interval (float): Delay between polls in seconds.
+        model_name (Optional[str]): Registered model to preload on the serving app.
+
+    Returns:
+        List[WarmupResult]: One result per service, in input order.
+    """
+    if not services:
+        return []
+    with ThreadPoolExecutor(max_workers=len(services)) as pool:
+        futures = [
+            pool.submit(warm_service, name, url, timeout, interval, model_name)
+            for name, url in services.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def serving_model_name(config: Dict) -> Optional[str]:
+    """Model to preload, from the model_serving tool's `model_name` param."""
+    for stage in config.get("stack", []):
+        for stage_name, tool in stage.items():
+            if stage_name == "model_serving":
+                return (tool.get("params") or {}).get("model_name")
+    return None
+
+
+def print_warmup_report(results: List[WarmupResult]) -> None:
+    """Render warm-up results as a table."""
+    table = Table(title="🔥 Service warm-up")
+    table.add_column("Service")
+    table.add_column("URL", overflow="fold")
+    table.add_column("Status")
+    table.add_column("Cold start", justify="right")
+    table.add_column("Model", justify="right")
+
+    for result in results:
+        if result.up:
+            status = f"[green]up ({result.status_code})[/green]"
+            cold_start = f"{result.cold_start_seconds:.1f}s"
+        else:
+            status = f"[red]down ({result.error})[/red]"
+            cold_start = "-"
+        if result.model_status is None:
+            model = "-"
+        elif result.model_load_seconds is not None:
+            model = f"{result.model_status} ({result.model_load_seconds:.1f}s)"
+        else:
+            model = result.model_status
+        table.add_row(result.name, result.url, status, cold_start, model)
+
+    Console().print(table)
@@ -0,0 +1,73 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from deployml.scoring import ParquetSink, ScoringConfig, run_scoring
+
+
+class DoubleModel:
+    def predict(self, features):
+        return features["x"].to_numpy() * 2
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "features"
+    path.mkdir()
+    table = pa.table({"id": list(range(100)), "x": [float(i) for i in range(100)]})
+    pq.write_table(table.slice(0, 60), path / "a.parquet")
+    pq.write_table(table.slice(60), path / "b.parquet")
+    return path
+
+
+def score_shards(source, sink, count, strategy, **kwargs):
+    for index in range(count):
+        config = ScoringConfig(
+            model_uri="unused",
+            source_path=str(source),
+            sink_path=str(sink),
+            id_columns=["id"],
+            batch_size=7,
+            shard_index=index,
+            shard_count=count,
+            shard_strategy=strategy,
+            shard_partition_column="id",
+            **kwargs,
+        )
+        config.validate(require_model=False)
+        run_scoring(config, model=DoubleModel())
+    return ds.dataset(str(sink), format="parquet").to_table().sort_by("id")
+
+
+@pytest.mark.parametrize(
+    "strategy, kwargs",
+    [("hash", {}), ("range", {"shard_key_min": "0", "shard_key_max": "100"})],
+)
+def test_shards_cover_every_row_once(source, tmp_path, strategy, kwargs):
+    result = score_shards(source, tmp_path / "out", 3, strategy, **kwargs)
+
+    assert result.column("id").to_pylist() == list(range(100))
+    assert result.column("prediction").to_pylist() == [i * 2.0 for i in range(100)]
+    assert len(list((tmp_path / "out").glob("part-0000[0-2]-*.parquet"))) == 3
+
+
+def test_relative_paths(source, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = score_shards(source.name, "out/predictions", 1, "hash")
+
+    assert result.num_rows == 100
+    assert (tmp_path / "out" / "predictions" / "part-00000-00000.parquet").exists()
+
+
+def test_sink_rolls_files(tmp_path):
+    sink = ParquetSink(str(tmp_path / "out"), rows_per_file=10)
+    batch = pa.record_batch({"id": list(range(10))})
+    for _ in range(3):
+        sink.write(batch)
+
+    files = sink.close()
+
+    assert len(files) == 3
+    assert sink.rows_written == 30
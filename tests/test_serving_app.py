@@ -0,0 +1,159 @@
+import asyncio
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from jinja2 import Environment, FileSystemLoader
+
+from deployml.utils.constants import TEMPLATE_DIR
+
+pytest.importorskip("fastapi")
+pytest.importorskip("prometheus_client")
+
+SAMPLE_CONFIG = "example/config/gcp-cloud-vm-sample.yaml"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Globals of the FastAPI serving app generated for the VM sample stack."""
+    with open(SAMPLE_CONFIG) as f:
+        config = yaml.safe_load(f)
+    template = Environment(loader=FileSystemLoader(TEMPLATE_DIR)).get_template("gcp/cloud_vm/main.tf.j2")
+    rendered = template.render(
+        cloud="gcp",
+        stack=config["stack"],
+        deployment_type="cloud_vm",
+        create_artifact_bucket=False,
+        bucket_configs=[],
+        project_id="test-project",
+        region="us-west1",
+        zone="us-west1-a",
+        stack_name=config["name"],
+        name_hash="abc123",
+    )
+    body = re.search(r"<< 'FASTAPI_TEMPLATE_EOF'\n(.*?)\nFASTAPI_TEMPLATE_EOF\n", rendered, re.S).group(1)
+    namespace = {"__name__": "serving_app"}
+    exec(compile(body.replace("$${", "${").replace("%%{", "%{"), "main.py", "exec"), namespace)
+    return namespace
+
+
+class LookupModel:
+    """Returns `outputs[x]` for each input row, in the container `wrap` builds."""
+
+    def __init__(self, outputs, wrap=np.asarray):
+        self.outputs = outputs
+        self.wrap = wrap
+
+    def predict(self, frame):
+        return self.wrap([self.outputs[x] for x in frame["x"]])
+
+
+def response_body(app, predictions) -> bytes:
+    """JSON the API sends for these predictions."""
+    return app["ORJSONResponse"]({"predictions": app["to_serializable"](predictions)}).body
+
+
+def predict(app, model, xs, cache):
+    app["model"] = model
+    app["PREDICTION_CACHE_ENABLED"] = cache
+    return asyncio.run(app["predict_rows"](pd.DataFrame({"x": xs})))
+
+
+@pytest.mark.parametrize(
+    "outputs, wrap",
+    [
+        ({1: "label_1000", 2: "label_7"}, np.asarray),
+        ({1: 0.5, 2: 7}, lambda values: np.asarray(values, dtype=object)),
+        ({1: 1.5, 2: 2}, np.asarray),
+        ({1: "yes", 2: 3}, lambda values: np.asarray(values, dtype=object)),
+        ({1: "yes", 2: 3}, list),
+        ({1: "a", 2: 2.5}, lambda values: pd.DataFrame({"label": values})),
+        ({1: 1.5, 2: 2}, lambda values: pd.Series(values, name="score")),
+    ],
+)
+def test_prediction_cache_keeps_outputs(app, outputs, wrap):
+    model = LookupModel(outputs, wrap)
+    xs = [2, 1, 2, 1]
+    expected = predict(app, model, xs, cache=False)
+
+    app["prediction_cache"].clear()
+    predict(app, model, [1], cache=True)
+    merged = predict(app, model, xs, cache=True)
+    cached = predict(app, model, xs, cache=True)
+
+    for result in (merged, cached):
+        assert type(result) is type(expected)
+        assert response_body(app, result) == response_body(app, expected)
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(result, expected)
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [np.asarray, list, lambda values: pd.DataFrame({"label": values})],
+)
+def test_predict_entities_serializes_any_output(app, monkeypatch, wrap):
+    from fastapi.testclient import TestClient
+
+    async def fetch_online_features(entities, *args):
+        return {"metadata": {"feature_names": ["x"]}, "results": [{"values": entities["house_id"]}]}
+
+    monkeypatch.setitem(app, "fetch_online_features", fetch_online_features)
+    monkeypatch.setitem(app, "model", LookupModel({1: "cheap", 2: "pricey"}, wrap))
+    monkeypatch.setitem(app, "PREDICTION_CACHE_ENABLED", False)
+
+    response = TestClient(app["app"]).post("/predict/entities", json={"entities": {"house_id": [1, 2]}})
+
+    assert response.status_code == 200
+    predictions = response.json()["predictions"]
+    assert predictions in (["cheap", "pricey"], [["cheap"], ["pricey"]])
+
+
+def test_deadline_keeps_slot_until_prediction_finishes(app, monkeypatch):
+    import threading
+
+    import httpx
+    from fastapi import FastAPI
+
+    release_model = threading.Event()
+
+    class BlockingModel:
+        def predict(self, frame):
+            release_model.wait(5)
+            return np.zeros(len(frame))
+
+    monkeypatch.setitem(app, "model", BlockingModel())
+    monkeypatch.setitem(app, "PREDICTION_CACHE_ENABLED", False)
+    monkeypatch.setitem(app, "MAX_CONCURRENT_REQUESTS", 1)
+    monkeypatch.setitem(app, "REQUEST_DEADLINE_SECONDS", 0.1)
+    monkeypatch.setitem(app, "QUEUE_TIMEOUT_SECONDS", 0.05)
+
+    inner = FastAPI()
+
+    @inner.post("/work")
+    async def work():
+        await app["predict_rows"](pd.DataFrame({"x": [1]}))
+        return {"ok": True}
+
+    admission = app["AdmissionControlMiddleware"](inner)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=admission)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            timed_out = await client.post("/work")
+            held = admission.slots.locked()
+            queued = await client.post("/work")
+            release_model.set()
+            await asyncio.sleep(0.1)
+            return timed_out.status_code, held, queued.status_code, admission.slots.locked()
+
+    timed_out, held, queued, locked_after = asyncio.run(scenario())
+
+    assert timed_out == 504
+    assert held
+    assert queued == 503
+    assert not locked_after